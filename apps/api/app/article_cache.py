@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.fetch_cache import evict_directory, write_json_atomic
+
+
+def _default_cache_dir() -> str:
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "article_cache"))
+
+
+@dataclass(frozen=True)
+class ArticleCacheConfig:
+    enabled: bool = os.getenv("NEXUS_ARTICLE_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+    directory: str = os.getenv("NEXUS_ARTICLE_CACHE_DIR", _default_cache_dir())
+    ttl_s: float = float(os.getenv("NEXUS_ARTICLE_CACHE_TTL_S", str(14 * 24 * 3600)))
+    max_bytes: int = int(float(os.getenv("NEXUS_ARTICLE_CACHE_MAX_MB", "128")) * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class CachedArticle:
+    url: str
+    text: str
+    fetched_at: float
+    max_chars: int
+
+
+@dataclass
+class ScrapeStats:
+    hits: int = 0
+    misses: int = 0
+    failures: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, *, hit: bool = False, failed: bool = False) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if failed:
+                self.failures += 1
+
+    def summary(self) -> str:
+        return f"scrape cache: {self.hits} hit(s), {self.misses} miss(es), {self.failures} failure(s)"
+
+
+def _path(cfg: ArticleCacheConfig, url: str) -> str:
+    return os.path.join(cfg.directory, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def load(url: str, *, max_chars: int, config: Optional[ArticleCacheConfig] = None) -> Optional[CachedArticle]:
+    """
+    Cached extracted text for the canonical article URL, or None when missing, expired, or
+    extracted with a smaller `max_chars` than requested.
+    """
+    cfg = config or ArticleCacheConfig()
+    if not cfg.enabled:
+        return None
+    path = _path(cfg, url)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    entry = CachedArticle(
+        url=data.get("url") or "",
+        text=data.get("text") or "",
+        fetched_at=float(data.get("fetched_at") or 0.0),
+        max_chars=int(data.get("max_chars") or 0),
+    )
+    if entry.url != url or time.time() - entry.fetched_at > cfg.ttl_s or entry.max_chars < max_chars:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry
+
+
+def store(url: str, text: str, *, max_chars: int, config: Optional[ArticleCacheConfig] = None) -> None:
+    cfg = config or ArticleCacheConfig()
+    if not cfg.enabled:
+        return
+    payload = {
+        "url": url,
+        "text": text,
+        "fetched_at": time.time(),
+        "max_chars": max_chars,
+        "chars": len(text),
+    }
+    if write_json_atomic(_path(cfg, url), payload):
+        evict_directory(cfg.directory, ttl_s=cfg.ttl_s, max_bytes=cfg.max_bytes)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import sys
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 
 import feedparser
 from urllib.parse import quote_plus
@@ -9,8 +13,14 @@ from urllib.parse import quote_plus
 from app.http_client import fetch_text
 from app.ingestion_types import RawIngestedItem
 from app.models import ItemType, TimestampConfidence, TimestampPrecision
+from app.parallel import run_cpu
 from app.time_semantics import EditionWindow
 from app.url_utils import canonicalize_url
+from app.watermarks import Watermark
+
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_SOURCE = "arXiv"
 
 
 def _arxiv_query_for_window(categories: Iterable[str], window: EditionWindow) -> str:
@@ -43,65 +53,162 @@ def _arxiv_external_id(entry_id: str | None) -> str | None:
     return entry_id.rsplit("/", 1)[-1]
 
 
-def fetch_arxiv_items(
+def _entry_to_raw(entry, window: EditionWindow) -> Optional[RawIngestedItem]:
+    title = " ".join((entry.get("title") or "").split())
+    entry_id = entry.get("id") or None
+    link = entry.get("link") or entry_id or ""
+    source_url = canonicalize_url(link)
+
+    published = _to_dt_utc(entry.get("published")) or _to_dt_utc(entry.get("updated"))
+    if published is None:
+        return None
+
+    if published < window.utc_start or published > window.utc_end:
+        return None
+
+    summary = (entry.get("summary") or "").strip()
+    tags = []
+    for t in entry.get("tags") or []:
+        term = (t.get("term") or "").strip()
+        if term:
+            tags.append(term)
+
+    canonical = canonicalize_url(entry_id) if entry_id else None
+    return RawIngestedItem(
+        item_type=ItemType.paper,
+        source=ARXIV_SOURCE,
+        source_url=source_url,
+        canonical_url=canonical,
+        external_id=_arxiv_external_id(entry_id),
+        title=title,
+        published_at_utc=published,
+        summary_text=summary,
+        content_text=summary,
+        tags=tags,
+        source_reliability="High",
+        timestamp_precision=TimestampPrecision.exact,
+        timestamp_confidence=TimestampConfidence.high,
+    )
+
+
+def _page_url(query: str, *, start: int, page_size: int) -> str:
+    return (
+        f"{ARXIV_API_URL}"
+        f"?search_query={quote_plus(query)}"
+        f"&start={start}&max_results={page_size}"
+        "&sortBy=submittedDate&sortOrder=descending"
+    )
+
+
+@dataclass(frozen=True)
+class ArxivPage:
+    items: list[RawIngestedItem]
+    entry_count: int
+    total: Optional[int]
+    reached_watermark: bool
+
+
+def parse_arxiv_page(document: str, window: EditionWindow, watermark: Optional[Watermark] = None) -> ArxivPage:
+    """
+    Parse one Atom page of arXiv results (CPU-bound; safe to run in a worker process).
+    """
+    parsed = feedparser.parse(document)
+    try:
+        total: Optional[int] = int(parsed.feed.get("opensearch_totalresults"))
+    except (TypeError, ValueError):
+        total = None
+
+    items: list[RawIngestedItem] = []
+    reached_watermark = False
+    for entry in parsed.entries:
+        raw = _entry_to_raw(entry, window)
+        if raw is None:
+            continue
+        if watermark is not None:
+            if watermark.exhausts(raw.published_at_utc, window.utc_start):
+                reached_watermark = True
+                break
+            if watermark.covers(raw.published_at_utc, raw.source_url):
+                continue
+        items.append(raw)
+    return ArxivPage(items=items, entry_count=len(parsed.entries), total=total, reached_watermark=reached_watermark)
+
+
+def iter_arxiv_items(
     window: EditionWindow,
     *,
     categories: List[str],
-    max_results: int = 200,
-) -> list[RawIngestedItem]:
+    page_size: int = 200,
+    max_pages: int = 40,
+    page_delay_s: float = 3.0,
+    watermark: Optional[Watermark] = None,
+    executor: Optional[Executor] = None,
+    on_truncated: Optional[Callable[[], None]] = None,
+) -> Iterator[RawIngestedItem]:
     """
-    Uses the arXiv API (Atom) and filters by submittedDate inside the UTC window.
+    Walks `start=` offsets of the arXiv API until the window's result set is exhausted,
+    yielding entries page by page. Sleeps `page_delay_s` between pages (arXiv asks for 3s).
+    Results are newest-first, so paging stops at the first entry below `watermark`.
+    Pages are parsed in `executor` when one is given. When `max_pages` runs out first, the
+    older end of the window was never fetched and `on_truncated` is called.
     """
     if not categories:
-        return []
+        return
 
     query = _arxiv_query_for_window(categories, window)
-    query_qs = quote_plus(query)
-    url = (
-        "https://export.arxiv.org/api/query"
-        f"?search_query={query_qs}"
-        f"&start=0&max_results={max_results}"
-        "&sortBy=submittedDate&sortOrder=descending"
-    )
-    parsed = feedparser.parse(fetch_text(url))
-
-    out: list[RawIngestedItem] = []
-    for entry in parsed.entries:
-        title = " ".join((entry.get("title") or "").split())
-        entry_id = entry.get("id") or None
-        link = entry.get("link") or entry_id or ""
-        source_url = canonicalize_url(link)
+    total: Optional[int] = None
+    start = 0
+    pages = 0
+    yielded = 0
+    while pages < max_pages:
+        if pages:
+            time.sleep(page_delay_s)
+        document = fetch_text(_page_url(query, start=start, page_size=page_size), use_cache=True)
+        page = run_cpu(executor, parse_arxiv_page, document, window, watermark)
+        pages += 1
+        if total is None:
+            total = page.total
+
+        for raw in page.items:
+            yielded += 1
+            yield raw
+
+        start += page.entry_count
+        if page.reached_watermark or page.entry_count < page_size or (total is not None and start >= total):
+            break
+    else:
+        print(
+            f"[warn] arXiv: stopped after max_pages={max_pages} with {start} of {total} results fetched",
+            file=sys.stderr,
+        )
+        if on_truncated is not None:
+            on_truncated()
 
-        published = _to_dt_utc(entry.get("published")) or _to_dt_utc(entry.get("updated"))
-        if published is None:
-            continue
+    print(f"arXiv: {yielded} item(s) from {pages} page(s), {total if total is not None else '?'} total hit(s)")
 
-        if published < window.utc_start or published > window.utc_end:
-            continue
 
-        summary = (entry.get("summary") or "").strip()
-        tags = []
-        for t in entry.get("tags") or []:
-            term = (t.get("term") or "").strip()
-            if term:
-                tags.append(term)
-
-        canonical = canonicalize_url(entry_id) if entry_id else None
-        out.append(
-            RawIngestedItem(
-                item_type=ItemType.paper,
-                source="arXiv",
-                source_url=source_url,
-                canonical_url=canonical,
-                external_id=_arxiv_external_id(entry_id),
-                title=title,
-                published_at_utc=published,
-                summary_text=summary,
-                content_text=summary,
-                tags=tags,
-                source_reliability="High",
-                timestamp_precision=TimestampPrecision.exact,
-                timestamp_confidence=TimestampConfidence.high,
-            )
+def fetch_arxiv_items(
+    window: EditionWindow,
+    *,
+    categories: List[str],
+    max_results: int = 200,
+    max_pages: int = 40,
+    page_delay_s: float = 3.0,
+    watermark: Optional[Watermark] = None,
+    executor: Optional[Executor] = None,
+) -> list[RawIngestedItem]:
+    """
+    Uses the arXiv API (Atom) and filters by submittedDate inside the UTC window.
+    `max_results` is the page size; all pages of the window are fetched (see `iter_arxiv_items`).
+    """
+    return list(
+        iter_arxiv_items(
+            window,
+            categories=categories,
+            page_size=max_results,
+            max_pages=max_pages,
+            page_delay_s=page_delay_s,
+            watermark=watermark,
+            executor=executor,
         )
-    return out
+    )
@@ -1,21 +1,20 @@
 from __future__ import annotations
 
+from app.keywords import HINT_KEYWORDS
 from app.models import ItemType, Section
 
 
 def classify_section(item_type: ItemType, text: str) -> Section:
-    t = (text or "").lower()
+    hits = HINT_KEYWORDS.scan(text or "")
 
     if item_type == ItemType.paper:
-        if any(k in t for k in ["protein", "molecule", "drug", "chemistry", "biology", "genomics", "materials", "crystal", "weather", "climate"]):
+        if "section.science" in hits:
             return Section.ai_for_science
-        if any(k in t for k in ["education", "classroom", "student", "teacher", "curriculum", "tutor", "learning outcome", "assessment", "rubric"]):
+        if "section.education" in hits:
             return Section.ai_education
         return Section.ai_theory_arch
 
-    if any(k in t for k in ["policy", "regulat", "law", "ban", "compliance", "election", "senate", "parliament", "antitrust", "investigation"]):
-        return Section.market_policy
-    if any(k in t for k in ["funding", "ipo", "acquisition", "merger", "valuation", "lawsuit", "fine"]):
+    if "section.policy" in hits or "section.business" in hits:
         return Section.market_policy
     return Section.product_tech
 
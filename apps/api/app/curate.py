@@ -2,17 +2,24 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from typing import Any
 
-from app.curation_prompt import item_payload, system_prompt, user_prompt
+from app.curation_prompt import item_payload, system_prompt, top_pick_payload, user_prompt
 from app.db import init_db, session_scope
+from app.editions import refresh_edition_snapshots
 from app.models import ItemType, Section, TimestampConfidence
 from app.openrouter_client import chat_json, load_openrouter_config
 from app.repo import list_items_for_edition
 from app.time_semantics import local_today
-from app.translate import translate_items_to_zh
+from app.translate import translate_items
+
+
+# Section curation calls in flight at once (each can take up to NEXUS_LLM_TIMEOUT_S).
+CURATE_CONCURRENCY = max(1, int(os.getenv("NEXUS_CURATE_CONCURRENCY", "3")))
 
 
 def _limit_by_section() -> dict[Section, int]:
@@ -31,17 +38,49 @@ def _candidate_limit(section: Section) -> int:
     return 24
 
 
+# Declared top picks score at least 0.7 (see `_apply_curation`); picks the LLM drops fall below.
+_DROPPED_PICK_MAX_SCORE = 0.69
+
+
+def _needs_curation(item, model: str) -> bool:
+    """
+    True for items never curated, re-ingested with a different content_hash since, or
+    curated with another model. A legacy row without a curated hash counts as changed once
+    re-ingest has given it a content_hash; rows with no recorded model keep their curation.
+    """
+    if item.curated_at_utc is None:
+        return True
+    if item.content_hash and item.curated_content_hash != item.content_hash:
+        return True
+    return item.curated_model is not None and item.curated_model != model
+
+
+def _bullets_md(bullets: list[str]) -> str:
+    return "\n".join([f"- {b}" for b in bullets])
+
+
 def _item_snippet(item) -> str:
     if item.item_type == ItemType.paper:
-        return item.summary_bullets_md or ""
+        return _bullets_md(item.summary_bullets or [])
     if item.market_impact_md:
         return item.market_impact_md
-    if item.summary_bullets_md:
-        return item.summary_bullets_md
+    if item.summary_bullets:
+        return _bullets_md(item.summary_bullets)
     return ""
 
 
-def _apply_curation(section: Section, payload: dict[str, Any], items_by_id: dict[str, Any]) -> tuple[int, list[str]]:
+def _apply_curation(
+    section: Section,
+    payload: dict[str, Any],
+    items_by_id: dict[str, Any],
+    *,
+    model: str,
+    picks_by_id: dict[str, Any] | None = None,
+) -> tuple[int, list[str]]:
+    """
+    Enrich the items sent to the LLM (`items_by_id`) and re-rank the current top picks that
+    were listed alongside them (`picks_by_id`) by their position in `top_ids`.
+    """
     updated = 0
     top_ids = [str(x) for x in (payload.get("top_ids") or []) if x]
     top_bonus: dict[str, float] = {}
@@ -57,8 +96,8 @@ def _apply_curation(section: Section, payload: dict[str, Any], items_by_id: dict
         tags = obj.get("tags") or []
         bullets = obj.get("summary_bullets") or []
 
-        item.tags_csv = ",".join([t.strip() for t in tags if isinstance(t, str) and t.strip()][:8])
-        item.summary_bullets_md = "\n".join([f"- {b.strip()}" for b in bullets if isinstance(b, str) and b.strip()])
+        item.tags = [t.strip() for t in tags if isinstance(t, str) and t.strip()][:8]
+        item.summary_bullets = [b.strip() for b in bullets if isinstance(b, str) and b.strip()]
 
         why = obj.get("why_it_matters")
         market = obj.get("market_impact")
@@ -86,17 +125,42 @@ def _apply_curation(section: Section, payload: dict[str, Any], items_by_id: dict
 
         if item.section != section:
             item.section = section
+        item.curated_at_utc = item.updated_at_utc = datetime.utcnow()
+        item.curated_model = model
+        item.curated_content_hash = item.content_hash
 
         updated += 1
 
+    if top_ids:
+        for item_id, item in (picks_by_id or {}).items():
+            if item_id in top_bonus:
+                score = top_bonus[item_id]
+            else:
+                score = min(item.rank_score, _DROPPED_PICK_MAX_SCORE)
+            if score != item.rank_score:
+                item.rank_score = round(score, 4)
+                item.updated_at_utc = datetime.utcnow()
+
     return updated, top_ids
 
 
-def curate_edition(edition_date_local: date, tz: str, *, dry_run: bool) -> None:
+def curate_edition(
+    edition_date_local: date,
+    tz: str,
+    *,
+    dry_run: bool,
+    concurrency: int = CURATE_CONCURRENCY,
+    use_llm_cache: bool = True,
+    full: bool = False,
+) -> None:
+    """
+    Only new or changed items (`_needs_curation`, or every candidate with `full`) go to the
+    LLM, together with the section's current top picks so it can re-rank them.
+    Sections with nothing new are skipped.
+    """
     init_db()
     with session_scope() as session:
         items = list_items_for_edition(session, edition_date_local.isoformat(), tz)
-        items_by_id = {str(i.id): i for i in items}
 
         by_section: dict[Section, list[Any]] = {s: [] for s in Section}
         for i in items:
@@ -106,14 +170,29 @@ def curate_edition(edition_date_local: date, tz: str, *, dry_run: bool) -> None:
         total_updated = 0
         total_top = 0
 
-        cfg = load_openrouter_config()
+        cfg = load_openrouter_config(use_cache=use_llm_cache)
         print(f"curating {edition_date_local.isoformat()} ({tz}) with model {cfg.model}")
 
+        requests: list[tuple[Section, str, dict[str, Any], dict[str, Any]]] = []
         for section in Section:
-            candidates = sorted(by_section.get(section, []), key=lambda x: x.published_at_utc, reverse=True)[: _candidate_limit(section)]
+            newest = sorted(by_section.get(section, []), key=lambda x: x.published_at_utc, reverse=True)[: _candidate_limit(section)]
+            candidates = [i for i in newest if full or _needs_curation(i, cfg.model)]
             if not candidates:
+                if newest:
+                    print(f"{section.value}: no new or changed items")
                 continue
 
+            candidate_ids = {str(i.id) for i in candidates}
+            picks = [
+                i
+                for i in sorted(by_section[section], key=lambda x: (x.rank_score, x.published_at_utc), reverse=True)
+                if i.curated_at_utc is not None and str(i.id) not in candidate_ids
+            ][: limits[section]]
+            top_picks_json = json.dumps(
+                [top_pick_payload(id=str(i.id), title=i.title, importance_score=round(i.rank_score * 100)) for i in picks],
+                ensure_ascii=False,
+            )
+
             items_json = json.dumps(
                 [
                     item_payload(
@@ -129,65 +208,49 @@ def curate_edition(edition_date_local: date, tz: str, *, dry_run: bool) -> None:
                 ],
                 ensure_ascii=False,
             )
+            prompt = user_prompt(section=section, top_k=limits[section], items_json=items_json, top_picks_json=top_picks_json)
+            requests.append((section, prompt, {str(i.id): i for i in candidates}, {str(i.id): i for i in picks}))
+
+        failed: list[Section] = []
+        workers = max(1, min(concurrency, len(requests)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="curate") as pool:
+            # Only prompts cross into the worker threads; ORM objects stay on this thread.
+            futures = [
+                (section, candidates, picks, pool.submit(chat_json, system=system_prompt(), user=prompt, config=cfg))
+                for section, prompt, candidates, picks in requests
+            ]
+            # Apply in Section order whatever order the calls finish in, so runs are reproducible.
+            for section, candidates, picks, future in futures:
+                try:
+                    updated, top_ids = _apply_curation(
+                        section, future.result(), candidates, model=cfg.model, picks_by_id=picks
+                    )
+                except Exception as e:  # noqa: BLE001
+                    # One bad section (timeout, malformed JSON) must not cost the others.
+                    print(f"[warn] curation failed for {section.value}: {e}", file=sys.stderr)
+                    failed.append(section)
+                    continue
+                total_updated += updated
+                total_top += len(top_ids)
 
-            payload = chat_json(
-                system=system_prompt(),
-                user=user_prompt(section=section, top_k=limits[section], items_json=items_json),
-                config=cfg,
-            )
-
-            updated, top_ids = _apply_curation(section, payload, items_by_id)
-            total_updated += updated
-            total_top += len(top_ids)
+                prefix = "[dry-run] " if dry_run else ""
+                print(f"{prefix}{section.value}: updated {updated}, top {len(top_ids)} ({len(picks)} earlier pick(s) re-ranked)")
 
-            prefix = "[dry-run] " if dry_run else ""
-            print(f"{prefix}{section.value}: updated {updated}, top {len(top_ids)}")
+        if requests and len(failed) == len(requests):
+            raise RuntimeError(f"curation failed for every section of {edition_date_local.isoformat()}")
 
         if not dry_run:
             session.commit()
 
-            # Translation pass (English -> Simplified Chinese) for UI toggle.
-            trans_in = []
-            for i in items:
-                trans_in.append(
-                    {
-                        "id": str(i.id),
-                        "title": i.title,
-                        "tags": [t.strip() for t in (i.tags_csv or "").split(",") if t.strip()],
-                        "summary_bullets": [
-                            b.strip("- ").strip() for b in (i.summary_bullets_md or "").splitlines() if b.strip()
-                        ],
-                        "why_it_matters": i.why_it_matters_md or None,
-                        "market_impact": i.market_impact_md or None,
-                    }
-                )
-
-            translated = translate_items_to_zh(trans_in)
-            for item_id, fields in translated.items():
-                it = items_by_id.get(item_id)
-                if not it:
-                    continue
-                title_zh = fields.get("title_zh")
-                if isinstance(title_zh, str) and title_zh.strip():
-                    it.title_zh = title_zh.strip()
-
-                tags_zh = fields.get("tags_zh") or []
-                it.tags_zh_csv = ",".join([t.strip() for t in tags_zh if isinstance(t, str) and t.strip()][:8])
-
-                bullets_zh = fields.get("summary_bullets_zh") or []
-                it.summary_bullets_zh_md = "\n".join(
-                    [f"- {b.strip()}" for b in bullets_zh if isinstance(b, str) and b.strip()]
-                )
+            # Translation pass (English -> Simplified Chinese) for UI toggle; only missing or stale zh fields.
+            translated = translate_items(session, items, use_llm_cache=use_llm_cache)
+            print(f"translation: updated zh fields for {translated} item(s)")
 
-                w = fields.get("why_it_matters_zh")
-                it.why_it_matters_zh_md = w.strip() if isinstance(w, str) and w.strip() else ""
-                m = fields.get("market_impact_zh")
-                it.market_impact_zh_md = m.strip() if isinstance(m, str) and m.strip() else ""
-
-            session.commit()
-            print("translation: updated zh fields")
+            refresh_edition_snapshots(session, edition_date_local, tz)
 
         print(f"done: updated {total_updated} item(s), top picks declared {total_top} (ids only)")
+        if failed:
+            print(f"[warn] sections left uncurated: {', '.join(s.value for s in failed)}", file=sys.stderr)
 
 
 def main() -> None:
@@ -201,6 +264,8 @@ def main() -> None:
         help="Comma-separated local edition dates (YYYY-MM-DD,YYYY-MM-DD). Overrides --date/--days if set.",
     )
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--full", action="store_true", help="Re-curate every candidate, not just new or changed items")
+    parser.add_argument("--no-llm-cache", action="store_true", help="Always call the LLM; bypass the response cache")
     args = parser.parse_args()
 
     tz = args.tz
@@ -225,7 +290,7 @@ def main() -> None:
 
     try:
         for d in dates:
-            curate_edition(d, tz, dry_run=bool(args.dry_run))
+            curate_edition(d, tz, dry_run=bool(args.dry_run), use_llm_cache=not args.no_llm_cache, full=bool(args.full))
     except Exception as e:  # noqa: BLE001
         print(f"error: {e}", file=sys.stderr)
         raise
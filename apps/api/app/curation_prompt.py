@@ -31,12 +31,13 @@ def user_prompt(
     section: Section,
     top_k: int,
     items_json: str,
+    top_picks_json: str = "[]",
 ) -> str:
     sec = section_display(section)
     return f"""
 Section: {sec}
 
-Goal: pick the top {top_k} items for this section and enrich ALL provided items with:
+Goal: pick the top {top_k} items for this section from the new items and the current top picks, and enrich ALL new items with:
 - tags (2-6 short keywords)
 - summary_bullets (papers: 3-5, news: 2-4)
 - why_it_matters (papers only; 1 sentence)
@@ -65,7 +66,12 @@ Return JSON in exactly this shape:
   ]
 }}
 
-Items (JSON array):
+top_ids may include ids of current top picks. Do not return current top picks in "items"; they are already enriched.
+
+Current top picks from earlier runs, best first (JSON array):
+{top_picks_json}
+
+New items (JSON array):
 {items_json}
 """.strip()
 
@@ -93,3 +99,6 @@ def item_payload(
         "snippet": snippet,
     }
 
+
+def top_pick_payload(*, id: str, title: str, importance_score: int) -> dict:
+    return {"id": id, "title": title, "importance_score": importance_score}
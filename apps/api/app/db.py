@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
 import os
 from contextlib import contextmanager
 
+from sqlalchemy import MetaData
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlmodel import Session, SQLModel, create_engine
 
 
@@ -18,37 +22,154 @@ connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite")
 engine = create_engine(DATABASE_URL, echo=False, connect_args=connect_args)
 
 
+# Legacy comma/markdown-encoded list columns -> (JSON list column, parser).
+_LEGACY_LIST_COLUMNS = {
+    "tags_csv": ("tags", "csv"),
+    "tags_zh_csv": ("tags_zh", "csv"),
+    "summary_bullets_md": ("summary_bullets", "md"),
+    "summary_bullets_zh_md": ("summary_bullets_zh", "md"),
+}
+
+
+def _parse_legacy_list(value: str | None, kind: str) -> list[str]:
+    if kind == "csv":
+        return [t.strip() for t in (value or "").split(",") if t.strip()]
+    return [b.strip("- ").strip() for b in (value or "").splitlines() if b.strip()]
+
+
+def _migrate_legacy_list_columns(cur) -> None:
+    """
+    Convert `tags_csv`/`*_md` list encodings into the JSON list columns once, then drop the
+    legacy columns (they are NOT NULL without a default, so they would break new inserts).
+    """
+    cur.execute("PRAGMA table_info(item)")
+    existing = {row[1] for row in cur.fetchall()}
+    legacy = [c for c in _LEGACY_LIST_COLUMNS if c in existing]
+    if not legacy:
+        return
+
+    cur.execute(f"SELECT id, {', '.join(legacy)} FROM item")
+    for row in cur.fetchall():
+        assignments = {}
+        for col, value in zip(legacy, row[1:]):
+            target, kind = _LEGACY_LIST_COLUMNS[col]
+            assignments[target] = json.dumps(_parse_legacy_list(value, kind), ensure_ascii=False)
+        sets = ", ".join(f"{c} = ?" for c in assignments)
+        cur.execute(f"UPDATE item SET {sets} WHERE id = ?", [*assignments.values(), row[0]])
+
+    _rebuild_item_table(cur)
+
+
+def _rebuild_item_table(cur) -> None:
+    """
+    Recreate `item` from the model's schema, keeping only the model's columns. This drops
+    the legacy columns without `ALTER TABLE ... DROP COLUMN`, which needs SQLite 3.35+.
+    """
+    from app.models import Item
+
+    dialect = sqlite.dialect()
+    rebuilt = Item.__table__.to_metadata(MetaData(), name="item__rebuild")
+    cur.execute("PRAGMA table_info(item)")
+    existing = {row[1] for row in cur.fetchall()}
+    columns = ", ".join(c.name for c in rebuilt.columns if c.name in existing)
+
+    cur.execute("DROP TABLE IF EXISTS item__rebuild")
+    cur.execute(str(CreateTable(rebuilt).compile(dialect=dialect)))
+    cur.execute(f"INSERT INTO item__rebuild ({columns}) SELECT {columns} FROM item")
+    cur.execute("DROP TABLE item")
+    cur.execute("ALTER TABLE item__rebuild RENAME TO item")
+    for index in Item.__table__.indexes:
+        cur.execute(str(CreateIndex(index).compile(dialect=dialect)))
+
+
+def _backfill_translation_hashes(cur) -> None:
+    """
+    Rows translated before `translation_source_hash` existed are taken to match their
+    current English fields, so the first incremental run does not re-translate them.
+    """
+    from app.translate import translation_source_hash
+
+    cur.execute(
+        "SELECT id, title, tags, summary_bullets, why_it_matters_md, market_impact_md "
+        "FROM item WHERE title_zh IS NOT NULL"
+    )
+    updates = []
+    for item_id, title, tags, bullets, why, market in cur.fetchall():
+        fields = {
+            "title": title,
+            "tags": list(json.loads(tags or "[]")),
+            "summary_bullets": list(json.loads(bullets or "[]")),
+            "why_it_matters": why or None,
+            "market_impact": market or None,
+        }
+        updates.append((translation_source_hash(fields), item_id))
+    cur.executemany("UPDATE item SET translation_source_hash = ? WHERE id = ?", updates)
+
+
 def _migrate_sqlite_schema() -> None:
     if not DATABASE_URL.startswith("sqlite"):
         return
     import sqlite3
 
-    # Ensure new optional bilingual columns exist without requiring a destructive migration.
+    # Ensure newly added optional columns exist without requiring a destructive migration.
     db_path = DATABASE_URL.replace("sqlite:///", "", 1)
     con = sqlite3.connect(db_path)
     try:
         cur = con.cursor()
-        cur.execute("PRAGMA table_info(item)")
-        existing = {row[1] for row in cur.fetchall()}
-
-        desired = {
-            "title_zh": "TEXT",
-            "tags_zh_csv": "TEXT NOT NULL DEFAULT ''",
-            "summary_bullets_zh_md": "TEXT NOT NULL DEFAULT ''",
-            "why_it_matters_zh_md": "TEXT NOT NULL DEFAULT ''",
-            "market_impact_zh_md": "TEXT NOT NULL DEFAULT ''",
+        desired_by_table = {
+            "item": {
+                "title_zh": "TEXT",
+                "tags": "JSON NOT NULL DEFAULT '[]'",
+                "tags_zh": "JSON NOT NULL DEFAULT '[]'",
+                "summary_bullets": "JSON NOT NULL DEFAULT '[]'",
+                "summary_bullets_zh": "JSON NOT NULL DEFAULT '[]'",
+                "why_it_matters_zh_md": "TEXT NOT NULL DEFAULT ''",
+                "market_impact_zh_md": "TEXT NOT NULL DEFAULT ''",
+                "content_hash": "TEXT NOT NULL DEFAULT ''",
+                "curated_at_utc": "DATETIME",
+                "curated_model": "TEXT",
+                "curated_content_hash": "TEXT",
+                "translation_source_hash": "TEXT",
+            },
+            "editionsnapshot": {
+                "last_modified_utc": "DATETIME",
+                "schema_version": "INTEGER NOT NULL DEFAULT 0",
+            },
         }
 
-        for col, ddl in desired.items():
-            if col in existing:
+        added: set[tuple[str, str]] = set()
+        for table, desired in desired_by_table.items():
+            cur.execute(f"PRAGMA table_info({table})")
+            existing = {row[1] for row in cur.fetchall()}
+            if not existing:
                 continue
-            cur.execute(f"ALTER TABLE item ADD COLUMN {col} {ddl}")
+            for col, ddl in desired.items():
+                if col in existing:
+                    continue
+                cur.execute(f"ALTER TABLE {table} ADD COLUMN {col} {ddl}")
+                added.add((table, col))
+
+        _migrate_legacy_list_columns(cur)
+        if ("item", "curated_at_utc") in added:
+            # Curation always ends with a translation pass, so translated rows were curated;
+            # keep re-ingest from overwriting their LLM fields with heuristics.
+            cur.execute("UPDATE item SET curated_at_utc = updated_at_utc WHERE title_zh IS NOT NULL")
+        if ("item", "curated_content_hash") in added:
+            # Rows curated before this column existed count as curated against their current hash.
+            cur.execute(
+                "UPDATE item SET curated_content_hash = content_hash "
+                "WHERE curated_at_utc IS NOT NULL AND content_hash != ''"
+            )
+        if ("item", "translation_source_hash") in added:
+            _backfill_translation_hashes(cur)
         con.commit()
     finally:
         con.close()
 
 
 def init_db() -> None:
+    import app.models  # noqa: F401  (register tables on SQLModel.metadata)
+
     SQLModel.metadata.create_all(engine)
     _migrate_sqlite_schema()
 
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Optional
+
+from sqlmodel import Session
+
+from app.models import EditionSnapshot, Item, Section
+from app.repo import (
+    canonical_timezone,
+    delete_stale_edition_snapshots,
+    edition_stats,
+    get_edition_snapshot,
+    list_top_items_by_section,
+    save_edition_snapshot,
+)
+from app.schemas import EditionOut, ItemOut
+from app.time_semantics import edition_window_for_local_date
+
+
+# Bump whenever `build_edition` / `item_to_out` change what a payload contains.
+SNAPSHOT_SCHEMA_VERSION = 1
+
+
+def limit_by_section() -> dict[Section, int]:
+    return {
+        Section.ai_for_science: 5,
+        Section.ai_theory_arch: 5,
+        Section.ai_education: 5,
+        Section.product_tech: 6,
+        Section.market_policy: 5,
+    }
+
+
+def item_to_out(item: Item, *, edition_timezone: Optional[str] = None) -> ItemOut:
+    """
+    Shared Item -> ItemOut serializer. Rows come from our own table, so the list columns
+    are already parsed and the model is constructed without re-validation.
+    """
+    return ItemOut.model_construct(
+        id=item.id,
+        item_type=item.item_type,
+        section=item.section,
+        title=item.title,
+        title_zh=item.title_zh,
+        source=item.source,
+        source_url=item.source_url,
+        canonical_url=item.canonical_url,
+        published_at_utc=item.published_at_utc,
+        edition_date_local=item.edition_date_local,
+        edition_timezone=edition_timezone or item.edition_timezone,
+        tags=list(item.tags or []),
+        tags_zh=list(item.tags_zh or []),
+        difficulty=item.difficulty,
+        summary_bullets=list(item.summary_bullets or []),
+        summary_bullets_zh=list(item.summary_bullets_zh or []),
+        why_it_matters=item.why_it_matters_md or None,
+        why_it_matters_zh=item.why_it_matters_zh_md or None,
+        market_impact=item.market_impact_md or None,
+        market_impact_zh=item.market_impact_zh_md or None,
+        source_reliability=item.source_reliability,
+        timestamp_precision=item.timestamp_precision,
+        timestamp_confidence=item.timestamp_confidence,
+        rank_score=item.rank_score,
+    )
+
+
+def build_edition(session: Session, edition_date_local: date, tz: str) -> EditionOut:
+    window = edition_window_for_local_date(edition_date_local, tz)
+    grouped = list_top_items_by_section(session, edition_date_local.isoformat(), tz, limit_by_section())
+    sections_out = {section: [item_to_out(i) for i in grouped.get(section, [])] for section in Section}
+    return EditionOut(
+        edition_date_local=edition_date_local.isoformat(),
+        edition_timezone=tz,
+        utc_date=window.utc_date.isoformat(),
+        utc_start=window.utc_start,
+        utc_end=window.utc_end,
+        sections=sections_out,
+    )
+
+
+def _build(session: Session, edition_date_local: date, tz: str) -> EditionSnapshot:
+    built_at = datetime.utcnow()
+    key = edition_date_local.isoformat()
+    _, last_modified = edition_stats(session, [key], tz)[key]
+    return EditionSnapshot(
+        edition_date_local=key,
+        edition_timezone=tz,
+        payload_json=build_edition(session, edition_date_local, tz).model_dump_json(),
+        last_modified_utc=last_modified,
+        built_at_utc=built_at,
+        schema_version=SNAPSHOT_SCHEMA_VERSION,
+    )
+
+
+def _for_timezone(snapshot: EditionSnapshot, tz: str) -> EditionSnapshot:
+    """
+    The canonical snapshot as served to an equivalent timezone: only `edition_timezone` differs.
+    """
+    payload = json.loads(snapshot.payload_json)
+    payload["edition_timezone"] = tz
+    return EditionSnapshot(
+        edition_date_local=snapshot.edition_date_local,
+        edition_timezone=tz,
+        payload_json=json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+        last_modified_utc=snapshot.last_modified_utc,
+        built_at_utc=snapshot.built_at_utc,
+        schema_version=snapshot.schema_version,
+    )
+
+
+def edition_snapshot(session: Session, edition_date_local: date, tz: str) -> EditionSnapshot:
+    """
+    Serialized `EditionOut` (plus its Last-Modified) for the edition, served from the
+    snapshot table when ingest/curate stored a current one. Anything else is built on the
+    fly and not stored, so reads never write.
+    """
+    canonical = canonical_timezone(tz)
+    snapshot = get_edition_snapshot(session, edition_date_local.isoformat(), canonical)
+    if snapshot is None or snapshot.schema_version != SNAPSHOT_SCHEMA_VERSION:
+        return _build(session, edition_date_local, tz)
+    if canonical != tz:
+        return _for_timezone(snapshot, tz)
+    return snapshot
+
+
+def refresh_edition_snapshots(session: Session, edition_date_local: date, tz: str) -> None:
+    """
+    Rebuild the stored snapshot after the edition's items changed (ingest/curate). One row
+    per group of equivalent timezones, keyed by `canonical_timezone`.
+    """
+    canonical = canonical_timezone(tz)
+    snapshot = _build(session, edition_date_local, canonical)
+    save_edition_snapshot(
+        session,
+        snapshot.edition_date_local,
+        canonical,
+        snapshot.payload_json,
+        last_modified_utc=snapshot.last_modified_utc,
+        built_at_utc=snapshot.built_at_utc,
+        schema_version=SNAPSHOT_SCHEMA_VERSION,
+    )
+    delete_stale_edition_snapshots(
+        session, snapshot.edition_date_local, canonical, schema_version=SNAPSHOT_SCHEMA_VERSION
+    )
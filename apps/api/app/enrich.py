@@ -1,37 +1,85 @@
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import replace
+from typing import Optional
+from urllib.parse import urlparse
 
+from app import article_cache
+from app.article_cache import ScrapeStats
 from app.ingestion_types import RawIngestedItem
 from app.models import ItemType, TimestampConfidence
 from app.scrape import scrape_article_text
 
 
+_MAX_CHARS = 12_000
+
+
+def _scrape_one(
+    item: RawIngestedItem,
+    host_limits: dict[str, threading.Semaphore],
+    stats: ScrapeStats,
+    executor: Optional[Executor],
+) -> RawIngestedItem:
+    key = item.canonical_url or item.source_url
+    cached = article_cache.load(key, max_chars=_MAX_CHARS)
+    if cached is not None:
+        stats.record(hit=True)
+        return replace(item, content_text=cached.text) if cached.text else item
+
+    try:
+        with host_limits[urlparse(item.source_url).netloc.lower()]:
+            text = scrape_article_text(item.source_url, max_chars=_MAX_CHARS, executor=executor)
+    except Exception:  # noqa: BLE001
+        # Network/parsing failures are common; degrade confidence and move on.
+        stats.record(failed=True)
+        return replace(item, timestamp_confidence=TimestampConfidence.low)
+
+    stats.record()
+    article_cache.store(key, text, max_chars=_MAX_CHARS)
+    if text:
+        return replace(item, content_text=text)
+    return item
+
+
 def enrich_with_scraping(
     items: list[RawIngestedItem],
     *,
     scrape_news: bool,
     max_news_to_scrape: int = 40,
+    max_workers: int = int(os.getenv("NEXUS_SCRAPE_MAX_WORKERS", "8")),
+    max_per_host: int = int(os.getenv("NEXUS_SCRAPE_MAX_PER_HOST", "2")),
+    stats: Optional[ScrapeStats] = None,
+    executor: Optional[Executor] = None,
 ) -> list[RawIngestedItem]:
+    """
+    Scrape the first `max_news_to_scrape` news items concurrently: at most `max_workers` pages
+    in flight, and at most `max_per_host` per domain. Output order matches `items`.
+    Extracted text is served from `app.article_cache` when available; `stats` counts hits/misses.
+    HTML extraction runs in `executor` (a process pool) when given.
+    """
     if not scrape_news:
         return items
 
-    out: list[RawIngestedItem] = []
-    scraped = 0
-    for item in items:
-        if item.item_type != ItemType.news or scraped >= max_news_to_scrape:
-            out.append(item)
-            continue
-
-        try:
-            text = scrape_article_text(item.source_url)
-            if text:
-                out.append(replace(item, content_text=text))
-            else:
-                out.append(item)
-        except Exception:  # noqa: BLE001
-            # Network/parsing failures are common; degrade confidence and move on.
-            out.append(replace(item, timestamp_confidence=TimestampConfidence.low))
-        scraped += 1
-    return out
+    targets = [idx for idx, item in enumerate(items) if item.item_type == ItemType.news][: max(0, max_news_to_scrape)]
+    if not targets:
+        return items
 
+    host_limits = {
+        urlparse(items[idx].source_url).netloc.lower(): threading.Semaphore(max(1, max_per_host)) for idx in targets
+    }
+    stats = stats if stats is not None else ScrapeStats()
+    out = list(items)
+    workers = max(1, min(max_workers, len(targets)))
+    if workers == 1:
+        for idx in targets:
+            out[idx] = _scrape_one(items[idx], host_limits, stats, executor)
+        return out
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape") as pool:
+        scraped = pool.map(lambda idx: _scrape_one(items[idx], host_limits, stats, executor), targets)
+        for idx, item in zip(targets, scraped):
+            out[idx] = item
+    return out
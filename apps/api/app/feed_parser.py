@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Iterator, Optional
+from urllib.parse import urljoin
+
+from lxml import etree
+
+
+class FeedParseError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    title: str
+    link: str
+    published_at_utc: Optional[datetime]
+    text: str
+    tags: list[str]
+
+
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+_ENTRY_TAGS = {"item", "entry"}
+_FEED_ROOTS = {"rss", "feed", "RDF", "channel"}
+# Namespaces whose elements fill entry fields: plain RSS 2.0, RSS 1.0, Atom 1.0 / 0.3.
+_CORE_NS = frozenset({"", "http://purl.org/rss/1.0/", "http://www.w3.org/2005/Atom", "http://purl.org/atom/ns#"})
+_DC_NS = frozenset({"http://purl.org/dc/elements/1.1/", "http://purl.org/dc/terms/"})
+_CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    RFC 822 (RSS pubDate) or ISO 8601 (Atom published/updated, dc:date), normalized to UTC.
+    """
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _local(tag) -> str:
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag.split(":")[-1]
+
+
+def _text(el) -> str:
+    return "".join(el.itertext()).strip()
+
+
+def _resolve(el, url: str) -> str:
+    """
+    Resolve a relative link against the element's xml:base (inherited from its ancestors).
+    """
+    base = el.base
+    return urljoin(base, url) if base and url else url
+
+
+def _split(tag) -> tuple[str, str]:
+    if not isinstance(tag, str):
+        return "", ""
+    if tag.startswith("{"):
+        ns, _, name = tag[1:].partition("}")
+        return ns, name
+    return "", tag
+
+
+def _entry(el) -> FeedEntry:
+    title = ""
+    dc_title = ""
+    link = ""
+    guid_link = ""
+    published = None
+    updated = None
+    summary = ""
+    content = ""
+    tags: list[str] = []
+
+    for child in el:
+        ns, name = _split(child.tag)
+        if ns in _DC_NS:
+            if name == "title":
+                dc_title = dc_title or " ".join(_text(child).split())
+            elif name == "issued":
+                published = published or _text(child)
+            elif name in {"date", "modified"}:
+                updated = updated or _text(child)
+            continue
+        if ns == _CONTENT_NS:
+            if name == "encoded":
+                content = content or _text(child)
+            continue
+        if ns not in _CORE_NS:
+            # Extension elements (media:title, itunes:summary, ...) never stand in for core fields.
+            continue
+
+        if name == "title":
+            title = title or " ".join(_text(child).split())
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                link = link or _resolve(child, _text(child))
+            elif child.get("rel") in (None, "alternate") and not link:
+                link = _resolve(child, href.strip())
+        elif name == "guid":
+            value = _text(child)
+            if child.get("isPermaLink", "true") != "false" and value.startswith("http"):
+                guid_link = value
+        elif name in {"pubDate", "published", "issued"}:
+            published = published or _text(child)
+        elif name in {"updated", "modified"}:
+            updated = updated or _text(child)
+        elif name in {"description", "summary"}:
+            summary = summary or _text(child)
+        elif name == "content":
+            content = content or _text(child)
+        elif name == "category":
+            term = (child.get("term") or _text(child)).strip()
+            if term:
+                tags.append(term)
+
+    return FeedEntry(
+        title=title or dc_title,
+        link=link or guid_link,
+        published_at_utc=parse_feed_date(published) or parse_feed_date(updated),
+        text=summary or content,
+        tags=tags,
+    )
+
+
+def iter_feed_entries(document: str) -> Iterator[FeedEntry]:
+    """
+    Lazily parse RSS 2.0 / RSS 1.0 / Atom entries in document order. Parsing stops as soon as
+    the caller stops iterating. Raises FeedParseError for malformed or non-feed documents.
+    """
+    data = _XML_DECL_RE.sub("", (document or "").lstrip("\ufeff"), count=1).encode("utf-8")
+    context = etree.iterparse(
+        BytesIO(data),
+        events=("start", "end"),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+    )
+    try:
+        root_checked = False
+        for event, el in context:
+            if event == "start":
+                if not root_checked:
+                    root_checked = True
+                    if _local(el.tag) not in _FEED_ROOTS:
+                        raise FeedParseError(f"not a feed document (root <{_local(el.tag)}>)")
+                continue
+            if _local(el.tag) not in _ENTRY_TAGS:
+                continue
+            entry = _entry(el)
+            # Entries are independent; drop parsed ones to keep memory flat on large feeds.
+            el.clear(keep_tail=False)
+            parent = el.getparent()
+            if parent is not None:
+                while el.getprevious() is not None:
+                    del parent[0]
+            yield entry
+    except etree.XMLSyntaxError as e:
+        raise FeedParseError(str(e)) from e
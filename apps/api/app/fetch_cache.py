@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+def _default_cache_dir() -> str:
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "http_cache"))
+
+
+@dataclass(frozen=True)
+class FetchCacheConfig:
+    enabled: bool = os.getenv("NEXUS_HTTP_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+    directory: str = os.getenv("NEXUS_HTTP_CACHE_DIR", _default_cache_dir())
+    # Entries older than this are not revalidated but fetched from scratch.
+    ttl_s: float = float(os.getenv("NEXUS_HTTP_CACHE_TTL_S", str(7 * 24 * 3600)))
+    max_bytes: int = int(float(os.getenv("NEXUS_HTTP_CACHE_MAX_MB", "64")) * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+_lock = threading.Lock()
+
+
+def _path(cfg: FetchCacheConfig, url: str) -> str:
+    return os.path.join(cfg.directory, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def load(url: str, *, config: Optional[FetchCacheConfig] = None) -> Optional[CachedResponse]:
+    cfg = config or FetchCacheConfig()
+    if not cfg.enabled:
+        return None
+    path = _path(cfg, url)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    entry = CachedResponse(
+        url=data.get("url") or url,
+        body=data.get("body") or "",
+        etag=data.get("etag"),
+        last_modified=data.get("last_modified"),
+        stored_at=float(data.get("stored_at") or 0.0),
+    )
+    if entry.url != url or time.time() - entry.stored_at > cfg.ttl_s:
+        return None
+    return entry
+
+
+def revalidated(
+    entry: CachedResponse,
+    *,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    config: Optional[FetchCacheConfig] = None,
+) -> None:
+    """
+    Record a 304 for `entry`: it counts as freshly stored, so an entry the server keeps
+    confirming never reaches its TTL. Validators sent with the 304 replace the old ones.
+    """
+    store(
+        entry.url,
+        entry.body,
+        etag=etag or entry.etag,
+        last_modified=last_modified or entry.last_modified,
+        config=config,
+    )
+
+
+def store(
+    url: str,
+    body: str,
+    *,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    config: Optional[FetchCacheConfig] = None,
+) -> None:
+    cfg = config or FetchCacheConfig()
+    # Without validators the entry could never be revalidated, so there is nothing to gain.
+    if not cfg.enabled or not (etag or last_modified):
+        return
+
+    payload = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "stored_at": time.time(),
+        "body": body,
+    }
+    if write_json_atomic(_path(cfg, url), payload):
+        evict_directory(cfg.directory, ttl_s=cfg.ttl_s, max_bytes=cfg.max_bytes)
+
+
+def write_json_atomic(path: str, payload: dict) -> bool:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        _remove(tmp)
+        return False
+    return True
+
+
+def evict_directory(directory: str, *, ttl_s: float, max_bytes: int) -> None:
+    """
+    Drop entries older than `ttl_s`, then least-recently-used (oldest mtime) entries until the
+    directory fits in `max_bytes`.
+    """
+    with _lock:
+        try:
+            names = [n for n in os.listdir(directory) if n.endswith(".json")]
+        except OSError:
+            return
+
+        entries = []
+        total = 0
+        now = time.time()
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if now - st.st_mtime > ttl_s:
+                _remove(path)
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
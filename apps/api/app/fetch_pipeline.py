@@ -1,43 +1,152 @@
 from __future__ import annotations
 
+import queue
 import sys
-from typing import List
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import urlparse
 
-from app.arxiv_source import fetch_arxiv_items
+from app.arxiv_source import ARXIV_API_URL, ARXIV_SOURCE, iter_arxiv_items
 from app.ingestion_types import RawIngestedItem
 from app.models import ItemType
 from app.rss_source import fetch_rss_items
 from app.source_config import SourceConfig
 from app.time_semantics import EditionWindow
+from app.watermarks import Watermark
 
 
-def fetch_all_sources(window: EditionWindow, *, config: SourceConfig) -> list[RawIngestedItem]:
-    out: List[RawIngestedItem] = []
+@dataclass(frozen=True)
+class _SourceJob:
+    source: str
+    host: str
+    fetch: Callable[[], Iterable[RawIngestedItem]]
+    failure_label: str
 
-    try:
-        out.extend(
-            fetch_arxiv_items(
+
+@dataclass(frozen=True)
+class _JobDone:
+    source: str
+    failed: bool
+
+
+def _host(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _source_jobs(
+    window: EditionWindow,
+    config: SourceConfig,
+    watermarks: dict[str, Watermark],
+    executor: Optional[Executor],
+    truncated_sources: Optional[set[str]] = None,
+) -> list[_SourceJob]:
+    on_arxiv_truncated = partial(truncated_sources.add, ARXIV_SOURCE) if truncated_sources is not None else None
+    jobs = [
+        _SourceJob(
+            source=ARXIV_SOURCE,
+            host=_host(ARXIV_API_URL),
+            fetch=partial(
+                iter_arxiv_items,
                 window,
                 categories=config.arxiv_categories,
-                max_results=config.arxiv_max_results,
-            )
+                page_size=config.arxiv_max_results,
+                max_pages=config.arxiv_max_pages,
+                page_delay_s=config.arxiv_page_delay_s,
+                watermark=watermarks.get(ARXIV_SOURCE),
+                executor=executor,
+                on_truncated=on_arxiv_truncated,
+            ),
+            failure_label="arXiv fetch failed",
         )
-    except Exception as e:  # noqa: BLE001
-        print(f"[warn] arXiv fetch failed: {e}", file=sys.stderr)
-
+    ]
     for name, url in config.industry_feeds:
-        try:
-            out.extend(
-                fetch_rss_items(
+        jobs.append(
+            _SourceJob(
+                source=name,
+                host=_host(url),
+                fetch=partial(
+                    fetch_rss_items,
                     window,
                     feed_url=url,
                     source_name=name,
                     item_type=ItemType.news,
                     max_items=config.industry_max_items_per_feed,
                     reliability="Medium",
-                )
+                    watermark=watermarks.get(name),
+                    executor=executor,
+                ),
+                failure_label=f"feed fetch failed ({name})",
             )
+        )
+    return jobs
+
+
+def iter_all_sources(
+    window: EditionWindow,
+    *,
+    config: SourceConfig,
+    watermarks: Optional[dict[str, Watermark]] = None,
+    executor: Optional[Executor] = None,
+    failed_sources: Optional[set[str]] = None,
+    truncated_sources: Optional[set[str]] = None,
+) -> Iterator[RawIngestedItem]:
+    """
+    Fetch arXiv and every industry feed concurrently (bounded by `fetch_max_workers` overall and
+    `fetch_max_per_host` per host). Entries covered by a source's watermark (keyed by source name)
+    are skipped. Downloads stay on threads; parsing is shipped to `executor` (a process pool)
+    when given.
+
+    Entries are yielded as soon as any source produces them (arXiv page by page), in arrival order. Fetch threads hand entries over through a
+    queue of at most `fetch_buffer_items`, so a slow consumer blocks the producers instead of
+    growing memory. Sources that fail, even after yielding some entries, are added to
+    `failed_sources`; sources that stopped before the older end of `window` (arXiv at
+    `max_pages`) are added to `truncated_sources`. Closing the generator early stops the fetch
+    threads.
+    """
+    jobs = _source_jobs(window, config, watermarks or {}, executor, truncated_sources)
+    host_limits = {job.host: threading.Semaphore(config.fetch_max_per_host) for job in jobs}
+    buffer: queue.Queue[object] = queue.Queue(maxsize=max(1, config.fetch_buffer_items))
+    stop = threading.Event()
+
+    def put(entry: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(job: _SourceJob) -> None:
+        failed = False
+        try:
+            if stop.is_set():
+                return
+            with host_limits[job.host]:
+                for item in job.fetch():
+                    if not put(item):
+                        return
         except Exception as e:  # noqa: BLE001
-            print(f"[warn] feed fetch failed ({name}): {e}", file=sys.stderr)
+            print(f"[warn] {job.failure_label}: {e}", file=sys.stderr)
+            failed = True
+        put(_JobDone(source=job.source, failed=failed))
 
-    return out
+    pending = len(jobs)
+    workers = max(1, min(config.fetch_max_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+        for job in jobs:
+            pool.submit(produce, job)
+        try:
+            while pending:
+                entry = buffer.get()
+                if isinstance(entry, _JobDone):
+                    pending -= 1
+                    if entry.failed and failed_sources is not None:
+                        failed_sources.add(entry.source)
+                    continue
+                yield entry  # type: ignore[misc]
+        finally:
+            stop.set()
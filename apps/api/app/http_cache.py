@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+# Past editions only change on explicit backfills/re-curation, so they can be cached for long.
+PAST_EDITION_MAX_AGE_S = int(os.getenv("NEXUS_CACHE_PAST_MAX_AGE_S", "86400"))
+LIVE_MAX_AGE_S = int(os.getenv("NEXUS_CACHE_LIVE_MAX_AGE_S", "60"))
+LIVE_STALE_WHILE_REVALIDATE_S = int(os.getenv("NEXUS_CACHE_LIVE_SWR_S", "300"))
+
+
+def etag_for(body: str | bytes) -> str:
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def cache_control(*, immutable: bool) -> str:
+    if immutable:
+        return f"public, max-age={PAST_EDITION_MAX_AGE_S}"
+    return f"public, max-age={LIVE_MAX_AGE_S}, stale-while-revalidate={LIVE_STALE_WHILE_REVALIDATE_S}"
+
+
+def _as_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2).
+    inm = request.headers.get("if-none-match")
+    if inm is not None:
+        return _etag_matches(inm, etag)
+
+    ims = request.headers.get("if-modified-since")
+    if ims and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(ims)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified) <= _as_utc(since)
+    return False
+
+
+def conditional_json_response(
+    request: Request,
+    body: str,
+    *,
+    last_modified: Optional[datetime],
+    immutable: bool,
+) -> Response:
+    """
+    JSON response carrying ETag/Last-Modified/Cache-Control, or a bodiless 304 when the
+    client's validators still match.
+    """
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control(immutable=immutable)}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
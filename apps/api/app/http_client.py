@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import atexit
 import os
+import threading
 from dataclasses import dataclass
 from typing import Optional
 
 import httpx
 
+from app import fetch_cache
+from app.retry_policy import RetryPolicy, call_with_retry
+
+
+def _env_flag(name: str, default: str = "0") -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
 
 @dataclass(frozen=True)
 class HttpConfig:
@@ -15,25 +24,142 @@ class HttpConfig:
         "NexusAIDaily/0.1 (+https://localhost; ingestion)",
     )
     max_retries: int = int(os.getenv("NEXUS_HTTP_MAX_RETRIES", "2"))
+    # Pool settings only apply when the shared client is first created.
+    max_connections: int = int(os.getenv("NEXUS_HTTP_MAX_CONNECTIONS", "32"))
+    max_keepalive_connections: int = int(os.getenv("NEXUS_HTTP_MAX_KEEPALIVE", "16"))
+    keepalive_expiry_s: float = float(os.getenv("NEXUS_HTTP_KEEPALIVE_EXPIRY_S", "30"))
+    http2: bool = _env_flag("NEXUS_HTTP2")
+    # Bodies are streamed and cut off after this many bytes.
+    max_bytes: int = int(os.getenv("NEXUS_HTTP_MAX_BYTES", str(10 * 1024 * 1024)))
+
+
+class UnsupportedContentType(ValueError):
+    pass
+
+
+# Content types we can parse: HTML pages and RSS/Atom/XML feeds (some feeds are served as text/*).
+_TEXTUAL_MARKERS = ("html", "xml", "rss", "atom", "text/")
+
+
+def _check_content_type(url: str, content_type: Optional[str]) -> None:
+    ct = (content_type or "").split(";", 1)[0].strip().lower()
+    if ct and not any(m in ct for m in _TEXTUAL_MARKERS):
+        raise UnsupportedContentType(f"unsupported content type {ct!r} for {url}")
+
+
+def _read_capped(resp: httpx.Response, max_bytes: int) -> str:
+    """
+    Read a streamed response up to `max_bytes`, closing the connection early past the cap.
+    """
+    buf = bytearray()
+    for chunk in resp.iter_bytes():
+        buf.extend(chunk)
+        if len(buf) >= max_bytes:
+            del buf[max_bytes:]
+            break
+    return bytes(buf).decode(resp.encoding or "utf-8", errors="replace")
+
+
+_lock = threading.Lock()
+_client: Optional[httpx.Client] = None
 
 
-def fetch_text(url: str, *, config: Optional[HttpConfig] = None) -> str:
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _client_kwargs(cfg: HttpConfig) -> dict:
+    return {
+        "headers": {"User-Agent": cfg.user_agent},
+        "follow_redirects": True,
+        "timeout": cfg.timeout_s,
+        "limits": httpx.Limits(
+            max_connections=cfg.max_connections,
+            max_keepalive_connections=cfg.max_keepalive_connections,
+            keepalive_expiry=cfg.keepalive_expiry_s,
+        ),
+        # HTTP/2 needs the optional `h2` package; fall back to HTTP/1.1 keep-alive without it.
+        "http2": cfg.http2 and _http2_available(),
+    }
+
+
+def get_client(config: Optional[HttpConfig] = None) -> httpx.Client:
+    """
+    Process-wide pooled client shared by RSS, arXiv and article scraping, so connections and
+    TLS sessions are reused across requests to the same host. Safe to use from threads.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(**_client_kwargs(config or HttpConfig()))
+    return _client
+
+
+def close_http_clients() -> None:
+    global _client
+    with _lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_http_clients)
+
+
+def _retry_policy(cfg: HttpConfig) -> RetryPolicy:
+    return RetryPolicy(max_retries=cfg.max_retries)
+
+
+def fetch_text(
+    url: str,
+    *,
+    config: Optional[HttpConfig] = None,
+    use_cache: bool = False,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """
+    GET `url` and return its body. The download is streamed: non-HTML/XML content types are
+    rejected from the headers alone, and the body is cut off after `max_bytes`
+    (default `HttpConfig.max_bytes`).
+    With `use_cache`, a previously stored body is revalidated with
+    If-None-Match/If-Modified-Since and reused on 304 (see `app.fetch_cache`).
+    Retries follow `app.retry_policy` (backoff, Retry-After, per-host circuit breaker).
+    """
     cfg = config or HttpConfig()
+    cap = max_bytes if max_bytes is not None else cfg.max_bytes
+    client = get_client(cfg)
+    cached = fetch_cache.load(url) if use_cache else None
     headers = {"User-Agent": cfg.user_agent}
-    last_exc: Exception | None = None
-    for attempt in range(cfg.max_retries + 1):
-        try:
-            with httpx.Client(
-                headers=headers,
-                follow_redirects=True,
-                timeout=cfg.timeout_s,
-            ) as client:
-                resp = client.get(url)
-                resp.raise_for_status()
-                return resp.text
-        except Exception as e:  # noqa: BLE001
-            last_exc = e
-            if attempt >= cfg.max_retries:
-                break
-    raise RuntimeError(f"fetch failed for {url}: {last_exc}") from last_exc
+    if cached is not None:
+        headers.update(cached.conditional_headers())
+
+    def attempt() -> str:
+        with client.stream("GET", url, headers=headers, timeout=cfg.timeout_s) as resp:
+            if resp.status_code == 304 and cached is not None:
+                fetch_cache.revalidated(
+                    cached,
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                )
+                return cached.body
+            resp.raise_for_status()
+            _check_content_type(url, resp.headers.get("Content-Type"))
+            text = _read_capped(resp, cap)
+        if use_cache:
+            fetch_cache.store(
+                url,
+                text,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+        return text
 
+    try:
+        return call_with_retry(attempt, url=url, policy=_retry_policy(cfg))
+    except Exception as e:  # noqa: BLE001
+        raise RuntimeError(f"fetch failed for {url}: {e}") from e
@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import argparse
-from datetime import date
+import os
+from contextlib import closing
+from datetime import date, datetime
+from functools import partial
+from typing import Optional
 
+from sqlmodel import Session
+
+from app.article_cache import ScrapeStats
 from app.db import init_db, session_scope
+from app.editions import refresh_edition_snapshots
 from app.enrich import enrich_with_scraping
-from app.fetch_pipeline import fetch_all_sources
+from app.fetch_pipeline import iter_all_sources
+from app.ingestion_types import RawIngestedItem
+from app.models import Item, ItemType
 from app.normalize import to_item_model
-from app.repo import upsert_by_source_url, upsert_item
+from app.parallel import map_cpu, process_pool
+from app.repo import bulk_upsert_items, get_source_watermarks, save_source_watermarks
 from app.seed import seed_items_for_window, to_model
 from app.source_config import load_source_config
-from app.time_semantics import edition_window_for_local_date, local_today
+from app.time_semantics import (
+    EditionWindow,
+    contiguous_range_starts,
+    covering_window,
+    edition_window_for_local_date,
+    local_today,
+    window_for_utc,
+)
+from app.watermarks import Watermark, advance_watermark
+
+
+INGEST_BATCH_SIZE = max(1, int(os.getenv("NEXUS_INGEST_BATCH_SIZE", "100")))
 
 
 def ingest_seed(edition_date_local: date, tz: str) -> int:
@@ -18,12 +40,9 @@ def ingest_seed(edition_date_local: date, tz: str) -> int:
     window = edition_window_for_local_date(edition_date_local, tz)
     seeded = seed_items_for_window(window)
 
-    written = 0
     with session_scope() as session:
-        for s in seeded:
-            model = to_model(s, window)
-            upsert_by_source_url(session, model)
-            written += 1
+        written = len(bulk_upsert_items(session, [to_model(s, window) for s in seeded]))
+        refresh_edition_snapshots(session, edition_date_local, tz)
     return written
 
 
@@ -35,41 +54,199 @@ def ingest_live(
     max_news_to_scrape: int,
     dry_run: bool,
     print_window: bool,
+    full: bool = False,
+    workers: int = 1,
+    batch_size: int = INGEST_BATCH_SIZE,
 ) -> int:
-    window = edition_window_for_local_date(edition_date_local, tz)
-    if print_window:
-        print(
-            f"edition {window.edition_date_local.isoformat()} ({tz}) => UTC {window.utc_date.isoformat()} "
-            f"[{window.utc_start.isoformat()} .. {window.utc_end.isoformat()}]"
-        )
+    return ingest_live_range(
+        [edition_date_local],
+        tz,
+        scrape_news=scrape_news,
+        max_news_to_scrape=max_news_to_scrape,
+        dry_run=dry_run,
+        print_window=print_window,
+        full=full,
+        workers=workers,
+        batch_size=batch_size,
+    )
 
-    config = load_source_config()
 
-    raw = fetch_all_sources(window, config=config)
-    raw = enrich_with_scraping(raw, scrape_news=scrape_news, max_news_to_scrape=max_news_to_scrape)
+def ingest_live_range(
+    edition_dates_local: list[date],
+    tz: str,
+    *,
+    scrape_news: bool,
+    max_news_to_scrape: int,
+    dry_run: bool,
+    print_window: bool,
+    full: bool = False,
+    workers: int = 1,
+    batch_size: int = INGEST_BATCH_SIZE,
+) -> int:
+    """
+    Fetch every source once over the union UTC range of the editions, then assign each entry
+    to its edition window. Backfills cost O(sources) requests instead of O(days x sources).
+    Unless `full`, entries below each source's watermark (already ingested) are skipped.
+    With `workers > 1`, feed/page parsing, article extraction and normalization run in a process
+    pool of that size; downloads stay on threads.
 
-    seen: set[str] = set()
-    written = 0
-    if dry_run:
-        for r in raw:
-            if r.source_url in seen:
-                continue
-            seen.add(r.source_url)
-            written += 1
-        return written
+    Entries stream from the fetch threads through enrich -> normalize -> upsert in batches of
+    `batch_size`, one commit per batch, so memory stays flat in the number of sources and early
+    entries are written while slow feeds are still downloading. Watermarks and edition snapshots
+    are only updated once every batch is written. With `scrape_news`, news entries are held back
+    until every feed is done and then written in feed config order (document order within a
+    feed), so the per-window scrape budget picks the same articles whatever order the fetch
+    threads finish in. A watermark only claims the runs of
+    consecutive edition windows that were requested (not the days between them), and for a
+    truncated source (arXiv at `max_pages`) only back to the oldest entry actually fetched.
+    """
+    windows = [edition_window_for_local_date(d, tz) for d in sorted(set(edition_dates_local), reverse=True)]
+    if print_window:
+        for window in windows:
+            print(
+                f"edition {window.edition_date_local.isoformat()} ({tz}) => UTC {window.utc_date.isoformat()} "
+                f"[{window.utc_start.isoformat()} .. {window.utc_end.isoformat()}]"
+            )
 
     init_db()
     with session_scope() as session:
-        for r in raw:
-            if r.source_url in seen:
-                continue
-            seen.add(r.source_url)
-            model = to_item_model(r, window)
-            upsert_item(session, model)
-            written += 1
+        current_marks = get_source_watermarks(session)
+
+    config = load_source_config()
+    span = covering_window(windows)
+    by_utc_date = {w.utc_date: w for w in windows}
+    range_starts = contiguous_range_starts(windows)
+    scrape_budget = {w.utc_date: max(0, max_news_to_scrape) for w in windows}
+    # (source, start of the window run) -> written entries at the newest timestamp in that run.
+    newest_written: dict[tuple[str, datetime], list[RawIngestedItem]] = {}
+    oldest_fetched: dict[str, datetime] = {}
+    failed_sources: set[str] = set()
+    truncated_sources: set[str] = set()
+    touched: set[date] = set()
+    seen: set[str] = set()
+    scrape_stats = ScrapeStats()
+    written = 0
+    # News entries wait for the end of the stream when scraping, see above.
+    held_news: list[tuple[EditionWindow, RawIngestedItem]] = []
+    feed_order = {name: idx for idx, (name, _) in enumerate(config.industry_feeds)}
+
+    def write_batch(session: Session, batch: list[tuple[EditionWindow, RawIngestedItem]]) -> int:
+        models: list[Item] = []
+        for window, items in _group_by_window(batch):
+            enriched = enrich_with_scraping(
+                items,
+                scrape_news=scrape_news,
+                max_news_to_scrape=scrape_budget[window.utc_date],
+                stats=scrape_stats,
+                executor=executor,
+            )
+            scrape_budget[window.utc_date] -= min(
+                scrape_budget[window.utc_date], sum(1 for r in items if r.item_type == ItemType.news)
+            )
+            models.extend(map_cpu(executor, partial(to_item_model, window=window), enriched))
+            touched.add(window.utc_date)
+            for r in items:
+                key = (r.source, range_starts[window.utc_date])
+                top = newest_written.get(key)
+                if top is None or r.published_at_utc > top[0].published_at_utc:
+                    newest_written[key] = [r]
+                elif r.published_at_utc == top[0].published_at_utc:
+                    top.append(r)
+
+        count = len(bulk_upsert_items(session, models))
+        session.expunge_all()
+        return count
+
+    with process_pool(workers) as executor:
+        stream = iter_all_sources(
+            span,
+            config=config,
+            watermarks={} if full else current_marks,
+            executor=executor,
+            failed_sources=failed_sources,
+            truncated_sources=truncated_sources,
+        )
+        with closing(stream), session_scope() as session:
+            batch: list[tuple[EditionWindow, RawIngestedItem]] = []
+            for r in stream:
+                if r.source not in oldest_fetched or r.published_at_utc < oldest_fetched[r.source]:
+                    oldest_fetched[r.source] = r.published_at_utc
+                if r.source_url in seen:
+                    continue
+                window = window_for_utc(by_utc_date, r.published_at_utc)
+                if window is None:
+                    continue
+                seen.add(r.source_url)
+                if dry_run:
+                    written += 1
+                    continue
+                if scrape_news and r.item_type == ItemType.news:
+                    held_news.append((window, r))
+                    continue
+                batch.append((window, r))
+                if len(batch) >= batch_size:
+                    written += write_batch(session, batch)
+                    batch = []
+            if dry_run:
+                return written
+            # Stable sort: entries of one feed keep their document order.
+            held_news.sort(key=lambda wr: feed_order.get(wr[1].source, len(feed_order)))
+            batch.extend(held_news)
+            for start in range(0, len(batch), batch_size):
+                written += write_batch(session, batch[start : start + batch_size])
+
+            for window in windows:
+                if window.utc_date in touched:
+                    refresh_edition_snapshots(session, window.edition_date_local, tz)
+
+            save_source_watermarks(
+                session,
+                _advanced_watermarks(
+                    current_marks,
+                    newest_written,
+                    failed_sources=failed_sources,
+                    truncated_oldest={s: oldest_fetched[s] for s in truncated_sources if s in oldest_fetched},
+                ),
+            )
+
+    if scrape_news:
+        print(scrape_stats.summary())
     return written
 
 
+def _advanced_watermarks(
+    current: dict[str, Watermark],
+    newest_written: dict[tuple[str, datetime], list[RawIngestedItem]],
+    *,
+    failed_sources: set[str],
+    truncated_oldest: dict[str, datetime],
+) -> dict[str, Watermark]:
+    """
+    Fold what was written, per source and run of consecutive windows, into the stored marks.
+    A source that failed mid-stream may have skipped older entries, so it keeps its old mark;
+    a truncated one only covers back to the oldest entry it fetched.
+    """
+    marks: dict[str, Optional[Watermark]] = dict(current)
+    advanced: set[str] = set()
+    for (source, range_start), items in newest_written.items():
+        if source in failed_sources:
+            continue
+        if source in truncated_oldest:
+            range_start = max(range_start, truncated_oldest[source])
+        marks[source] = advance_watermark(marks.get(source), items, range_start_utc=range_start)
+        advanced.add(source)
+    return {s: m for s in advanced if (m := marks.get(s)) is not None}
+
+
+def _group_by_window(
+    batch: list[tuple[EditionWindow, RawIngestedItem]],
+) -> list[tuple[EditionWindow, list[RawIngestedItem]]]:
+    groups: dict[date, tuple[EditionWindow, list[RawIngestedItem]]] = {}
+    for window, r in batch:
+        groups.setdefault(window.utc_date, (window, []))[1].append(r)
+    return list(groups.values())
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Nexus AI Daily ingestion")
     parser.add_argument("--tz", default="Asia/Shanghai")
@@ -86,6 +263,24 @@ def main() -> None:
     parser.add_argument("--dry-run", action="store_true", help="Fetch + filter, but do not write to DB")
     parser.add_argument("--print-window", action="store_true", help="Print the UTC window for the edition date(s)")
     parser.add_argument("--curate", action="store_true", help="After ingestion, run LLM curation for the edition(s)")
+    parser.add_argument("--no-llm-cache", action="store_true", help="With --curate: bypass the LLM response cache")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore per-source watermarks and re-process every entry in the window(s)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=INGEST_BATCH_SIZE,
+        help=f"Entries per DB commit in live mode (default: {INGEST_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for CPU-bound parsing/normalization in live mode (default: 1, in-process)",
+    )
     args = parser.parse_args()
 
     tz = args.tz
@@ -109,22 +304,27 @@ def main() -> None:
         dates = [d.fromordinal(d.toordinal() - i) for i in range(args.days)]
 
     total = 0
-    for day in dates:
-        if args.mode == "seed":
+    if args.mode == "seed":
+        for day in dates:
             total += ingest_seed(day, tz)
-        else:
-            total += ingest_live(
-                day,
-                tz,
-                scrape_news=bool(args.scrape_news),
-                max_news_to_scrape=int(args.max_news_to_scrape),
-                dry_run=bool(args.dry_run),
-                print_window=bool(args.print_window),
-            )
-        if args.curate and not args.dry_run:
-            from app.curate import curate_edition
+    else:
+        total = ingest_live_range(
+            dates,
+            tz,
+            scrape_news=bool(args.scrape_news),
+            max_news_to_scrape=int(args.max_news_to_scrape),
+            dry_run=bool(args.dry_run),
+            print_window=bool(args.print_window),
+            full=bool(args.full),
+            workers=max(1, int(args.workers)),
+            batch_size=max(1, int(args.batch_size)),
+        )
+
+    if args.curate and not args.dry_run:
+        from app.curate import curate_edition
 
-            curate_edition(day, tz, dry_run=False)
+        for day in dates:
+            curate_edition(day, tz, dry_run=False, use_llm_cache=not args.no_llm_cache)
 
     label = "seeded" if args.mode == "seed" else "ingested"
     if args.dry_run and args.mode == "live":
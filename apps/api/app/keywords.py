@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, Mapping
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Alternation of `words` factored by common prefix ("ab(?:lation|out)"), so the regex engine
+    rejects most positions on their first character. Longer words are tried first.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = []
+        end = "" in node
+        for ch in sorted(k for k in node if k):
+            branches.append(re.escape(ch) + render(node[ch]))
+        if not branches:
+            return ""
+        if len(branches) == 1 and not end:
+            return branches[0]
+        alternation = "(?:" + "|".join(branches) + ")"
+        return alternation + "?" if end else alternation
+
+    return render(trie)
+
+
+class KeywordMatcher:
+    """
+    Substring keyword matcher over named categories for the ingest heuristics:
+    `"category" in matcher.scan(text)` equals `any(k in text.lower() for k in keywords)`.
+
+    `scan` lowercases the text once and makes one pass with a compiled alternation of every
+    keyword. The match sits in a lookahead, so occurrences that overlap are all found; a
+    keyword that only occurs inside a longer one is implied by it. Immutable once built.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        by_word: dict[str, set[str]] = {}
+        for category, words in categories.items():
+            for word in words:
+                word = word.lower()
+                if not word:
+                    raise ValueError(f"empty keyword for {category!r}")
+                by_word.setdefault(word, set()).add(category)
+
+        # Categories implied by a match of `word`: its own, plus those of every keyword inside it.
+        self._implied: dict[str, frozenset[str]] = {
+            word: frozenset(c for other, cats in by_word.items() if other in word for c in cats) for word in by_word
+        }
+        self._pattern = re.compile(f"(?=({_trie_pattern(by_word)}))")
+
+    def scan(self, text: str) -> frozenset[str]:
+        words = set(self._pattern.findall((text or "").lower()))
+        return frozenset().union(*(self._implied[word] for word in words))
+
+
+# One matcher for every heuristic hint.
+HINT_KEYWORDS = KeywordMatcher(
+    {
+        "section.science": ["protein", "molecule", "drug", "chemistry", "biology", "genomics", "materials", "crystal", "weather", "climate"],
+        "section.education": ["education", "classroom", "student", "teacher", "curriculum", "tutor", "learning outcome", "assessment", "rubric"],
+        "section.policy": ["policy", "regulat", "law", "ban", "compliance", "election", "senate", "parliament", "antitrust", "investigation"],
+        "section.business": ["funding", "ipo", "acquisition", "merger", "valuation", "lawsuit", "fine"],
+        "why.code": ["open source", "code", "github"],
+        "why.benchmark": ["benchmark", "dataset"],
+        "why.theory": ["theorem", "proof"],
+        "market.regulation": ["regulat", "policy", "law", "ban", "compliance"],
+        "market.capital": ["funding", "acquisition", "valuation", "ipo"],
+        "market.product": ["launch", "release", "product", "api", "model"],
+        "difficulty.advanced": ["theorem", "proof", "convergence", "optimality", "complexity bound"],
+        "difficulty.intermediate": ["ablation", "benchmark", "dataset", "experiment"],
+    }
+)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.fetch_cache import evict_directory, write_json_atomic
+
+
+def _default_cache_dir() -> str:
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "llm_cache"))
+
+
+@dataclass(frozen=True)
+class LlmCacheConfig:
+    enabled: bool = os.getenv("NEXUS_LLM_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+    directory: str = os.getenv("NEXUS_LLM_CACHE_DIR", _default_cache_dir())
+    ttl_s: float = float(os.getenv("NEXUS_LLM_CACHE_TTL_S", str(30 * 24 * 3600)))
+    max_bytes: int = int(float(os.getenv("NEXUS_LLM_CACHE_MAX_MB", "64")) * 1024 * 1024)
+
+
+def cache_key(*, model: str, temperature: float, system: str, user: str) -> str:
+    blob = json.dumps([model, temperature, system, user], ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _path(cfg: LlmCacheConfig, key: str) -> str:
+    return os.path.join(cfg.directory, key + ".json")
+
+
+def load(key: str, *, config: Optional[LlmCacheConfig] = None) -> Optional[Any]:
+    """
+    Parsed JSON response stored for `key`, or None when missing or expired.
+    """
+    cfg = config or LlmCacheConfig()
+    if not cfg.enabled:
+        return None
+    path = _path(cfg, key)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("key") != key or time.time() - float(data.get("stored_at") or 0.0) > cfg.ttl_s:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data.get("response")
+
+
+def store(key: str, response: Any, *, model: str, config: Optional[LlmCacheConfig] = None) -> None:
+    cfg = config or LlmCacheConfig()
+    if not cfg.enabled or response is None:
+        return
+    payload = {"key": key, "model": model, "stored_at": time.time(), "response": response}
+    if write_json_atomic(_path(cfg, key), payload):
+        evict_directory(cfg.directory, ttl_s=cfg.ttl_s, max_bytes=cfg.max_bytes)
@@ -2,20 +2,25 @@ from __future__ import annotations
 
 from datetime import date
 from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, Response
+from pydantic import TypeAdapter
 
 from app.db import init_db, session_scope
-from app.models import Section
-from app.repo import get_item, list_items_for_edition, top_by_section
+from app.editions import edition_snapshot, item_to_out
+from app.http_cache import conditional_json_response
+from app.repo import edition_stats, get_item
 from app.schemas import EditionMetaOut, EditionOut, ItemOut
 from app.time_semantics import edition_window_for_local_date, local_today
 
 
 app = FastAPI(title="Nexus AI Daily API (MVP)")
 
+_edition_list_adapter = TypeAdapter(list[EditionMetaOut])
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -25,6 +30,13 @@ app.add_middleware(
 )
 
 
+def _require_timezone(tz: str) -> None:
+    try:
+        ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="tz must be an IANA timezone name") from e
+
+
 @app.on_event("startup")
 def _startup() -> None:
     init_db()
@@ -79,99 +91,61 @@ def health() -> dict:
 
 @app.get("/api/editions", response_model=list[EditionMetaOut])
 def list_editions(
+    request: Request,
     tz: str = Query(default="Asia/Shanghai"),
     days: int = Query(default=7, ge=1, le=14),
-) -> list[EditionMetaOut]:
+) -> Response:
+    _require_timezone(tz)
     today = local_today(tz)
     dates = [today.fromordinal(today.toordinal() - i) for i in range(days)]
 
-    out: list[EditionMetaOut] = []
     with session_scope() as session:
-        for d in dates:
-            window = edition_window_for_local_date(d, tz)
-            edition_date_local = d.isoformat()
-            items = list_items_for_edition(session, edition_date_local, tz)
-            out.append(
-                EditionMetaOut(
-                    edition_date_local=edition_date_local,
-                    edition_timezone=tz,
-                    utc_date=window.utc_date.isoformat(),
-                    utc_start=window.utc_start,
-                    utc_end=window.utc_end,
-                    item_count=len(items),
-                )
+        stats = edition_stats(session, [d.isoformat() for d in dates], tz)
+
+    out: list[EditionMetaOut] = []
+    for d in dates:
+        window = edition_window_for_local_date(d, tz)
+        edition_date_local = d.isoformat()
+        out.append(
+            EditionMetaOut(
+                edition_date_local=edition_date_local,
+                edition_timezone=tz,
+                utc_date=window.utc_date.isoformat(),
+                utc_start=window.utc_start,
+                utc_end=window.utc_end,
+                item_count=stats[edition_date_local][0],
             )
-    return out
+        )
+
+    last_modified = max((lm for _, lm in stats.values() if lm is not None), default=None)
+    body = _edition_list_adapter.dump_json(out).decode("utf-8")
+    return conditional_json_response(request, body, last_modified=last_modified, immutable=False)
 
 
 @app.get("/api/editions/{edition_date_local}", response_model=EditionOut)
 def get_edition(
+    request: Request,
     edition_date_local: str,
     tz: str = Query(default="Asia/Shanghai"),
-) -> EditionOut:
+) -> Response:
+    _require_timezone(tz)
     try:
         d = date.fromisoformat(edition_date_local)
     except ValueError as e:
         raise HTTPException(status_code=400, detail="edition_date_local must be YYYY-MM-DD") from e
 
-    window = edition_window_for_local_date(d, tz)
     with session_scope() as session:
-        items = list_items_for_edition(session, edition_date_local, tz)
-
-    limit_by_section = {
-        Section.ai_for_science: 5,
-        Section.ai_theory_arch: 5,
-        Section.ai_education: 5,
-        Section.product_tech: 6,
-        Section.market_policy: 5,
-    }
-    grouped = top_by_section(items, limit_by_section)
-
-    def to_out(item) -> ItemOut:
-        tags = [t.strip() for t in (item.tags_csv or "").split(",") if t.strip()]
-        tags_zh = [t.strip() for t in (item.tags_zh_csv or "").split(",") if t.strip()]
-        bullets = [b.strip("- ").strip() for b in (item.summary_bullets_md or "").splitlines() if b.strip()]
-        bullets_zh = [b.strip("- ").strip() for b in (item.summary_bullets_zh_md or "").splitlines() if b.strip()]
-        return ItemOut(
-            id=item.id,
-            item_type=item.item_type,
-            section=item.section,
-            title=item.title,
-            title_zh=item.title_zh,
-            source=item.source,
-            source_url=item.source_url,
-            canonical_url=item.canonical_url,
-            published_at_utc=item.published_at_utc,
-            edition_date_local=item.edition_date_local,
-            edition_timezone=item.edition_timezone,
-            tags=tags,
-            tags_zh=tags_zh,
-            difficulty=item.difficulty,
-            summary_bullets=bullets,
-            summary_bullets_zh=bullets_zh,
-            why_it_matters=item.why_it_matters_md or None,
-            why_it_matters_zh=item.why_it_matters_zh_md or None,
-            market_impact=item.market_impact_md or None,
-            market_impact_zh=item.market_impact_zh_md or None,
-            source_reliability=item.source_reliability,
-            timestamp_precision=item.timestamp_precision,
-            timestamp_confidence=item.timestamp_confidence,
-            rank_score=item.rank_score,
-        )
-
-    sections_out = {section: [to_out(i) for i in grouped.get(section, [])] for section in Section}
-    return EditionOut(
-        edition_date_local=edition_date_local,
-        edition_timezone=tz,
-        utc_date=window.utc_date.isoformat(),
-        utc_start=window.utc_start,
-        utc_end=window.utc_end,
-        sections=sections_out,
+        snapshot = edition_snapshot(session, d, tz)
+    return conditional_json_response(
+        request,
+        snapshot.payload_json,
+        last_modified=snapshot.last_modified_utc,
+        immutable=d < local_today(tz),
     )
 
 
 @app.get("/api/items/{item_id}", response_model=ItemOut)
-def item_detail(item_id: str, tz: Optional[str] = None) -> ItemOut:
+def item_detail(request: Request, item_id: str, tz: Optional[str] = None) -> Response:
     from uuid import UUID
 
     try:
@@ -184,33 +158,10 @@ def item_detail(item_id: str, tz: Optional[str] = None) -> ItemOut:
         if item is None:
             raise HTTPException(status_code=404, detail="not found")
 
-    tags = [t.strip() for t in (item.tags_csv or "").split(",") if t.strip()]
-    tags_zh = [t.strip() for t in (item.tags_zh_csv or "").split(",") if t.strip()]
-    bullets = [b.strip("- ").strip() for b in (item.summary_bullets_md or "").splitlines() if b.strip()]
-    bullets_zh = [b.strip("- ").strip() for b in (item.summary_bullets_zh_md or "").splitlines() if b.strip()]
-    return ItemOut(
-        id=item.id,
-        item_type=item.item_type,
-        section=item.section,
-        title=item.title,
-        title_zh=item.title_zh,
-        source=item.source,
-        source_url=item.source_url,
-        canonical_url=item.canonical_url,
-        published_at_utc=item.published_at_utc,
-        edition_date_local=item.edition_date_local,
-        edition_timezone=item.edition_timezone if tz is None else tz,
-        tags=tags,
-        tags_zh=tags_zh,
-        difficulty=item.difficulty,
-        summary_bullets=bullets,
-        summary_bullets_zh=bullets_zh,
-        why_it_matters=item.why_it_matters_md or None,
-        why_it_matters_zh=item.why_it_matters_zh_md or None,
-        market_impact=item.market_impact_md or None,
-        market_impact_zh=item.market_impact_zh_md or None,
-        source_reliability=item.source_reliability,
-        timestamp_precision=item.timestamp_precision,
-        timestamp_confidence=item.timestamp_confidence,
-        rank_score=item.rank_score,
+    out = item_to_out(item, edition_timezone=tz)
+    return conditional_json_response(
+        request,
+        out.model_dump_json(),
+        last_modified=item.updated_at_utc,
+        immutable=False,
     )
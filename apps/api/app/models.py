@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import JSON, Column
 from sqlmodel import Field, SQLModel
 
 
@@ -48,12 +49,14 @@ class Item(SQLModel, table=True):
     edition_date_local: str = Field(index=True)
     edition_timezone: str = Field(index=True)
 
-    tags_csv: str = Field(default="")
-    tags_zh_csv: str = Field(default="")
+    tags: List[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False, server_default="[]"))
+    tags_zh: List[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False, server_default="[]"))
     difficulty: Optional[str] = Field(default=None)
 
-    summary_bullets_md: str = Field(default="")
-    summary_bullets_zh_md: str = Field(default="")
+    summary_bullets: List[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False, server_default="[]"))
+    summary_bullets_zh: List[str] = Field(
+        default_factory=list, sa_column=Column(JSON, nullable=False, server_default="[]")
+    )
     why_it_matters_md: str = Field(default="")
     why_it_matters_zh_md: str = Field(default="")
     market_impact_md: str = Field(default="")
@@ -65,5 +68,68 @@ class Item(SQLModel, table=True):
 
     rank_score: float = Field(default=0.0, index=True)
 
+    # Hash of the values ingestion produced (ITEM_SOURCE_FIELDS + ITEM_HEURISTIC_FIELDS);
+    # an unchanged hash means a re-ingest has nothing to write.
+    content_hash: str = Field(default="")
+    # Set by LLM curation; from then on ingestion no longer touches ITEM_HEURISTIC_FIELDS.
+    curated_at_utc: Optional[datetime] = Field(default=None)
+    # Model and content_hash of the last curation; the item is curated again when either changes.
+    curated_model: Optional[str] = Field(default=None)
+    curated_content_hash: Optional[str] = Field(default=None)
+    # Hash of the English fields the zh fields were translated from; stale when it no longer matches.
+    translation_source_hash: Optional[str] = Field(default=None)
+
     created_at_utc: datetime = Field(default_factory=lambda: datetime.utcnow())
     updated_at_utc: datetime = Field(default_factory=lambda: datetime.utcnow())
+
+
+# Owned by the source: refreshed whenever the source content changes.
+ITEM_SOURCE_FIELDS = (
+    "item_type",
+    "title",
+    "source",
+    "source_url",
+    "canonical_url",
+    "external_id",
+    "published_at_utc",
+    "edition_date_local",
+    "edition_timezone",
+    "timestamp_precision",
+)
+
+# Ingestion's heuristic first guesses, replaced by curation. The *_zh fields belong to
+# translation and are never written by ingestion.
+ITEM_HEURISTIC_FIELDS = (
+    "section",
+    "tags",
+    "difficulty",
+    "summary_bullets",
+    "why_it_matters_md",
+    "market_impact_md",
+    "source_reliability",
+    "timestamp_confidence",
+    "rank_score",
+)
+
+
+class EditionSnapshot(SQLModel, table=True):
+    edition_date_local: str = Field(primary_key=True)
+    edition_timezone: str = Field(primary_key=True)
+
+    payload_json: str
+    last_modified_utc: Optional[datetime] = Field(default=None)
+    built_at_utc: datetime = Field(default_factory=lambda: datetime.utcnow())
+    # Serializer version the payload was built with; other versions are treated as missing.
+    schema_version: int = Field(default=0)
+
+
+class SourceWatermark(SQLModel, table=True):
+    source: str = Field(primary_key=True)
+
+    # Every entry of this source published in [covered_from_utc, published_at_utc] has been ingested.
+    covered_from_utc: datetime
+    published_at_utc: datetime
+    # source_urls of the entries published exactly at `published_at_utc`.
+    seen_keys: List[str] = Field(default_factory=list, sa_column=Column(JSON, nullable=False, server_default="[]"))
+
+    updated_at_utc: datetime = Field(default_factory=lambda: datetime.utcnow())
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from app.classify import classify_section
 from app.ingestion_types import RawIngestedItem
+from app.keywords import HINT_KEYWORDS
 from app.models import Item, ItemType, TimestampConfidence, TimestampPrecision
 from app.summarize import market_impact_hint, summarize_bullets, why_it_matters_hint
 from app.text_utils import strip_htmlish
@@ -21,10 +22,10 @@ def _uuid_from_dedup_key(key: str) -> UUID:
 
 
 def _difficulty_hint(text: str) -> str | None:
-    t = (text or "").lower()
-    if any(k in t for k in ["theorem", "proof", "convergence", "optimality", "complexity bound"]):
+    hits = HINT_KEYWORDS.scan(text or "")
+    if "difficulty.advanced" in hits:
         return "Advanced"
-    if any(k in t for k in ["ablation", "benchmark", "dataset", "experiment"]):
+    if "difficulty.intermediate" in hits:
         return "Intermediate"
     return None
 
@@ -62,8 +63,6 @@ def to_item_model(raw: RawIngestedItem, window: EditionWindow) -> Item:
     else:
         bullets = summarize_bullets(ItemType.news, title, raw.content_text or raw.summary_text or "", max_bullets=4)
 
-    summary_md = "\n".join([f"- {b}" for b in bullets])
-
     why = why_it_matters_hint(raw.item_type, title, raw.summary_text or raw.content_text or "")
     market = market_impact_hint(raw.item_type, title, raw.content_text or raw.summary_text or "")
 
@@ -89,9 +88,9 @@ def to_item_model(raw: RawIngestedItem, window: EditionWindow) -> Item:
         published_at_utc=raw.published_at_utc.astimezone(timezone.utc),
         edition_date_local=window.edition_date_local.isoformat(),
         edition_timezone=window.edition_timezone,
-        tags_csv=",".join(cleaned_tags),
+        tags=cleaned_tags,
         difficulty=_difficulty_hint(combined_text) if raw.item_type == ItemType.paper else None,
-        summary_bullets_md=summary_md,
+        summary_bullets=bullets,
         why_it_matters_md=why or "",
         market_impact_md=market or "",
         source_reliability=raw.source_reliability,
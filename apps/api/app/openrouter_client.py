@@ -7,6 +7,9 @@ from typing import Any, Optional
 
 import httpx
 
+from app import llm_cache
+from app.retry_policy import RetryPolicy, call_with_retry, is_retryable
+
 
 @dataclass(frozen=True)
 class OpenRouterConfig:
@@ -17,13 +20,16 @@ class OpenRouterConfig:
     max_retries: int = int(os.getenv("NEXUS_LLM_MAX_RETRIES", "1"))
     referer: Optional[str] = os.getenv("OPENROUTER_HTTP_REFERER")
     title: Optional[str] = os.getenv("OPENROUTER_X_TITLE", "Nexus AI Daily")
+    temperature: float = 0.2
+    # Serve/store completions through `app.llm_cache` (also subject to NEXUS_LLM_CACHE).
+    use_cache: bool = True
 
 
-def load_openrouter_config() -> OpenRouterConfig:
+def load_openrouter_config(*, use_cache: bool = True) -> OpenRouterConfig:
     api_key = os.getenv("OPENROUTER_API_KEY") or os.getenv("NEXUS_OPENROUTER_API_KEY") or ""
     if not api_key:
         raise RuntimeError("Missing OPENROUTER_API_KEY (or NEXUS_OPENROUTER_API_KEY)")
-    return OpenRouterConfig(api_key=api_key)
+    return OpenRouterConfig(api_key=api_key, use_cache=use_cache)
 
 
 def _strip_code_fences(text: str) -> str:
@@ -35,13 +41,28 @@ def _strip_code_fences(text: str) -> str:
     return t
 
 
+def _retryable(exc: Exception) -> bool:
+    # A truncated or non-JSON completion is worth another attempt; a 401/400 is not.
+    return is_retryable(exc) or isinstance(exc, (ValueError, KeyError, IndexError, TypeError))
+
+
 def chat_json(
     *,
     system: str,
     user: str,
     config: Optional[OpenRouterConfig] = None,
 ) -> Any:
+    """
+    One JSON-mode chat completion. Identical (model, temperature, system, user) requests are
+    answered from the on-disk LLM cache, so re-runs and backfills don't pay twice.
+    """
     cfg = config or load_openrouter_config()
+    key = llm_cache.cache_key(model=cfg.model, temperature=cfg.temperature, system=system, user=user)
+    if cfg.use_cache:
+        cached = llm_cache.load(key)
+        if cached is not None:
+            return cached
+
     headers = {
         "Authorization": f"Bearer {cfg.api_key}",
         "Content-Type": "application/json",
@@ -57,22 +78,30 @@ def chat_json(
             {"role": "system", "content": system},
             {"role": "user", "content": user},
         ],
-        "temperature": 0.2,
+        "temperature": cfg.temperature,
         "response_format": {"type": "json_object"},
     }
 
-    last_exc: Exception | None = None
-    for attempt in range(cfg.max_retries + 1):
-        try:
-            with httpx.Client(timeout=cfg.timeout_s) as client:
-                resp = client.post(f"{cfg.base_url}/chat/completions", headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                content = data["choices"][0]["message"]["content"]
-                return json.loads(_strip_code_fences(content))
-        except Exception as e:  # noqa: BLE001
-            last_exc = e
-            if attempt >= cfg.max_retries:
-                break
-    raise RuntimeError(f"OpenRouter request failed: {last_exc}") from last_exc
+    url = f"{cfg.base_url}/chat/completions"
+
+    def attempt() -> Any:
+        with httpx.Client(timeout=cfg.timeout_s) as client:
+            resp = client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            data = resp.json()
+            content = data["choices"][0]["message"]["content"]
+            return json.loads(_strip_code_fences(content))
+
+    try:
+        result = call_with_retry(
+            attempt,
+            url=url,
+            policy=RetryPolicy(max_retries=cfg.max_retries),
+            retryable=_retryable,
+        )
+    except Exception as e:  # noqa: BLE001
+        raise RuntimeError(f"OpenRouter request failed: {e}") from e
 
+    if cfg.use_cache:
+        llm_cache.store(key, result, model=cfg.model)
+    return result
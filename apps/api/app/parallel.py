@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@contextmanager
+def process_pool(workers: int) -> Iterator[Optional[Executor]]:
+    """
+    Process pool for CPU-bound parsing/normalization, or None (serial, in-process) when
+    `workers <= 1`. Uses the spawn start method: the pool is fed from fetch threads, and
+    forking a multi-threaded process is unsafe.
+    """
+    if workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        yield pool
+
+
+def run_cpu(executor: Optional[Executor], fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """
+    Run `fn` in the pool when one is given (blocking the calling thread only), inline otherwise.
+    `fn` and its arguments must be picklable.
+    """
+    if executor is None:
+        return fn(*args, **kwargs)
+    return executor.submit(fn, *args, **kwargs).result()
+
+
+def map_cpu(
+    executor: Optional[Executor],
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    chunksize: int = 16,
+) -> Iterator[R]:
+    """
+    Ordered map over `items`, streamed back as results complete in order.
+    """
+    if executor is None:
+        return map(fn, items)
+    return executor.map(fn, items, chunksize=chunksize)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime
 from typing import Iterable, Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import and_, delete, or_
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, func, select
 
-from app.models import Item, Section
+from app.models import ITEM_HEURISTIC_FIELDS, ITEM_SOURCE_FIELDS, EditionSnapshot, Item, Section, SourceWatermark
+from app.watermarks import Watermark, watermark_from_row
 
 
 def _equivalent_timezones(tz: str) -> list[str]:
@@ -19,6 +24,13 @@ def _equivalent_timezones(tz: str) -> list[str]:
     return [tz]
 
 
+def canonical_timezone(tz: str) -> str:
+    """
+    One name per group of `_equivalent_timezones`, used to key per-edition snapshots.
+    """
+    return _equivalent_timezones(tz)[0]
+
+
 def get_item(session: Session, item_id: UUID) -> Optional[Item]:
     return session.get(Item, item_id)
 
@@ -34,36 +46,202 @@ def list_items_for_edition(session: Session, edition_date_local: str, tz: str) -
     return list(session.exec(stmt).all())
 
 
+def list_top_items_by_section(
+    session: Session,
+    edition_date_local: str,
+    tz: str,
+    limit_by_section: dict[Section, int],
+) -> dict[Section, list[Item]]:
+    """
+    Database-side equivalent of `top_by_section(list_items_for_edition(...), limit_by_section)`.
+    Rows are numbered per section with ROW_NUMBER() so only the top-N of each section are loaded;
+    sections missing from `limit_by_section` are returned in full.
+    """
+    tzs = _equivalent_timezones(tz)
+    ordering = (Item.rank_score.desc(), Item.published_at_utc.desc())
+    rn = func.row_number().over(partition_by=Item.section, order_by=ordering).label("rn")
+    ranked = (
+        select(Item.id.label("id"), Item.section.label("section"), rn)
+        .where(Item.edition_date_local == edition_date_local)
+        .where(Item.edition_timezone.in_(tzs))
+        .subquery()
+    )
+
+    conds = [and_(ranked.c.section == section, ranked.c.rn <= limit) for section, limit in limit_by_section.items()]
+    limited = list(limit_by_section.keys())
+    if len(limited) < len(Section):
+        conds.append(ranked.c.section.not_in(limited))
+
+    stmt = select(Item).join(ranked, Item.id == ranked.c.id).where(or_(*conds)).order_by(*ordering)
+
+    grouped: dict[Section, list[Item]] = {s: [] for s in Section}
+    for item in session.exec(stmt).all():
+        grouped[item.section].append(item)
+    return grouped
+
+
+def edition_stats(session: Session, dates: Iterable[str], tz: str) -> dict[str, tuple[int, Optional[datetime]]]:
+    """
+    (item count, max updated_at_utc) per edition date in a single GROUP BY query.
+    Dates without any items are reported as (0, None).
+    """
+    wanted = list(dict.fromkeys(dates))
+    if not wanted:
+        return {}
+    tzs = _equivalent_timezones(tz)
+    stmt = (
+        select(Item.edition_date_local, func.count(Item.id), func.max(Item.updated_at_utc))
+        .where(Item.edition_date_local.in_(wanted))
+        .where(Item.edition_timezone.in_(tzs))
+        .group_by(Item.edition_date_local)
+    )
+    stats: dict[str, tuple[int, Optional[datetime]]] = {d: (0, None) for d in wanted}
+    for edition_date_local, n, last_updated in session.exec(stmt).all():
+        stats[edition_date_local] = (int(n), last_updated)
+    return stats
+
+
+def count_items_by_edition(session: Session, dates: Iterable[str], tz: str) -> dict[str, int]:
+    return {d: n for d, (n, _) in edition_stats(session, dates, tz).items()}
+
+
 def count_items_for_edition(session: Session, edition_date_local: str, tz: str) -> int:
-    return len(list_items_for_edition(session, edition_date_local, tz))
+    return count_items_by_edition(session, [edition_date_local], tz)[edition_date_local]
 
 
-def upsert_item(session: Session, incoming: Item) -> Item:
-    existing = session.exec(select(Item).where(Item.source_url == incoming.source_url)).first()
-    if existing is None and incoming.external_id:
-        existing = (
-            session.exec(select(Item).where(Item.source == incoming.source).where(Item.external_id == incoming.external_id))
-            .first()
-        )
-    if existing is None and incoming.canonical_url:
-        existing = session.exec(select(Item).where(Item.canonical_url == incoming.canonical_url)).first()
+_IN_CHUNK = 500
+
+
+def _chunks(values: list, size: int = _IN_CHUNK) -> Iterable[list]:
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+def _prefetch_matches(session: Session, items: list[Item]) -> list[Item]:
+    """
+    Load every existing row an incoming item could match, using one IN-query per match key
+    (source_url, external_id, canonical_url) instead of up to three SELECTs per item.
+    """
+    source_urls = list({i.source_url for i in items})
+    external_ids = list({i.external_id for i in items if i.external_id})
+    canonical_urls = list({i.canonical_url for i in items if i.canonical_url})
+
+    found: dict[UUID, Item] = {}
+    for column, values in (
+        (Item.source_url, source_urls),
+        (Item.external_id, external_ids),
+        (Item.canonical_url, canonical_urls),
+    ):
+        for chunk in _chunks(values):
+            for row in session.exec(select(Item).where(column.in_(chunk))).all():
+                found[row.id] = row
+    return list(found.values())
+
+
+class _MatchIndex:
+    def __init__(self, rows: Iterable[Item]) -> None:
+        self.by_url: dict[str, Item] = {}
+        self.by_external: dict[tuple[str, str], Item] = {}
+        self.by_canonical: dict[str, Item] = {}
+        for row in rows:
+            self.add(row)
+
+    def add(self, row: Item) -> None:
+        self.by_url.setdefault(row.source_url, row)
+        if row.external_id:
+            self.by_external.setdefault((row.source, row.external_id), row)
+        if row.canonical_url:
+            self.by_canonical.setdefault(row.canonical_url, row)
+
+    def match(self, incoming: Item) -> Optional[Item]:
+        # Same precedence as the historical per-item lookups: source_url, then
+        # (source, external_id), then canonical_url.
+        existing = self.by_url.get(incoming.source_url)
+        if existing is None and incoming.external_id:
+            existing = self.by_external.get((incoming.source, incoming.external_id))
+        if existing is None and incoming.canonical_url:
+            existing = self.by_canonical.get(incoming.canonical_url)
+        return existing
 
+
+def item_content_hash(item: Item) -> str:
+    """
+    Stable hash of the values ingestion produces for an item: its source fields plus the
+    heuristic fields derived from the source text.
+    """
+    payload = {name: getattr(item, name) for name in (*ITEM_SOURCE_FIELDS, *ITEM_HEURISTIC_FIELDS)}
+    blob = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def bulk_upsert_items(session: Session, items: Iterable[Item]) -> list[Item]:
+    """
+    Upsert many items in one transaction: prefetch candidate rows with IN-queries, merge in
+    memory, then write once (INSERT ... ON CONFLICT on Postgres, one ORM flush elsewhere).
+    Rows whose `content_hash` is unchanged are not written at all. Changed rows get their
+    source fields refreshed; heuristic fields only until the row has been curated, and the
+    translated *_zh fields never. Returns the persisted rows in input order.
+    """
+    incoming = list(items)
+    if not incoming:
+        return []
+
+    index = _MatchIndex(_prefetch_matches(session, incoming))
     now = datetime.utcnow()
-    if existing is None:
-        incoming.created_at_utc = now
-        incoming.updated_at_utc = now
-        session.add(incoming)
-        session.commit()
-        session.refresh(incoming)
-        return incoming
+    out: list[Item] = []
+    changed: list[Item] = []
+    for item in incoming:
+        item.content_hash = item_content_hash(item)
+        existing = index.match(item)
+        if existing is None:
+            item.created_at_utc = now
+            item.updated_at_utc = now
+            session.add(item)
+            index.add(item)
+            out.append(item)
+            changed.append(item)
+            continue
+
+        out.append(existing)
+        if existing.content_hash == item.content_hash:
+            continue
 
-    for field_name, value in incoming.model_dump(exclude={"id", "created_at_utc"}).items():
-        setattr(existing, field_name, value)
-    existing.updated_at_utc = now
-    session.add(existing)
+        fields = ITEM_SOURCE_FIELDS if existing.curated_at_utc is not None else ITEM_SOURCE_FIELDS + ITEM_HEURISTIC_FIELDS
+        for field_name in fields:
+            setattr(existing, field_name, getattr(item, field_name))
+        existing.content_hash = item.content_hash
+        existing.updated_at_utc = now
+        changed.append(existing)
+
+    if changed and session.get_bind().dialect.name == "postgresql":
+        _write_on_conflict(session, changed)
     session.commit()
-    session.refresh(existing)
-    return existing
+    return out
+
+
+def _write_on_conflict(session: Session, rows: list[Item]) -> None:
+    from sqlalchemy.dialects.postgresql import insert
+
+    unique: dict[UUID, Item] = {}
+    for row in rows:
+        unique[row.id] = row
+    # The rows are written by the statement below; keep the ORM from flushing them again.
+    for row in unique.values():
+        session.expunge(row)
+
+    columns = list(Item.model_fields.keys())
+    values = [{c: getattr(row, c) for c in columns} for row in unique.values()]
+    for chunk in _chunks(values):
+        stmt = insert(Item).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Item.id],
+            set_={c: stmt.excluded[c] for c in columns if c not in {"id", "created_at_utc"}},
+        )
+        session.exec(stmt)
+
+
+def upsert_item(session: Session, incoming: Item) -> Item:
+    return bulk_upsert_items(session, [incoming])[0]
 
 
 def upsert_by_source_url(session: Session, incoming: Item) -> Item:
@@ -71,6 +249,87 @@ def upsert_by_source_url(session: Session, incoming: Item) -> Item:
     return upsert_item(session, incoming)
 
 
+def get_edition_snapshot(session: Session, edition_date_local: str, tz: str) -> Optional[EditionSnapshot]:
+    return session.get(EditionSnapshot, (edition_date_local, tz))
+
+
+def save_edition_snapshot(
+    session: Session,
+    edition_date_local: str,
+    tz: str,
+    payload_json: str,
+    *,
+    last_modified_utc: Optional[datetime],
+    built_at_utc: datetime,
+    schema_version: int,
+) -> None:
+    """
+    Store a pre-serialized edition unless a snapshot of the same version built later already
+    exists. `built_at_utc` must be taken before the items were read, so a slower concurrent
+    rebuild can never overwrite a newer snapshot.
+    """
+    existing = get_edition_snapshot(session, edition_date_local, tz)
+    if existing is not None:
+        if existing.schema_version == schema_version and existing.built_at_utc >= built_at_utc:
+            return
+        existing.payload_json = payload_json
+        existing.last_modified_utc = last_modified_utc
+        existing.built_at_utc = built_at_utc
+        existing.schema_version = schema_version
+        session.add(existing)
+    else:
+        session.add(
+            EditionSnapshot(
+                edition_date_local=edition_date_local,
+                edition_timezone=tz,
+                payload_json=payload_json,
+                last_modified_utc=last_modified_utc,
+                built_at_utc=built_at_utc,
+                schema_version=schema_version,
+            )
+        )
+    try:
+        session.commit()
+    except IntegrityError:
+        # Another run stored the same snapshot concurrently.
+        session.rollback()
+
+
+def delete_stale_edition_snapshots(session: Session, edition_date_local: str, tz: str, *, schema_version: int) -> None:
+    """
+    Drop snapshots built by another serializer version, and non-canonical timezone keys for
+    `edition_date_local` (rows written before snapshots were keyed by `canonical_timezone`).
+    """
+    stale = or_(
+        EditionSnapshot.schema_version != schema_version,
+        and_(EditionSnapshot.edition_date_local == edition_date_local, EditionSnapshot.edition_timezone != tz),
+    )
+    session.exec(delete(EditionSnapshot).where(stale))
+    session.commit()
+
+
+def get_source_watermarks(session: Session) -> dict[str, Watermark]:
+    rows = session.exec(select(SourceWatermark)).all()
+    return {r.source: watermark_from_row(r.covered_from_utc, r.published_at_utc, r.seen_keys or []) for r in rows}
+
+
+def save_source_watermarks(session: Session, watermarks: dict[str, Watermark]) -> None:
+    now = datetime.utcnow()
+    for source, mark in watermarks.items():
+        row = session.get(SourceWatermark, source) or SourceWatermark(
+            source=source,
+            covered_from_utc=mark.covered_from_utc,
+            published_at_utc=mark.published_at_utc,
+        )
+        # SQLite stores naive datetimes; keep everything in naive UTC like the Item table.
+        row.covered_from_utc = mark.covered_from_utc.replace(tzinfo=None)
+        row.published_at_utc = mark.published_at_utc.replace(tzinfo=None)
+        row.seen_keys = sorted(mark.seen_keys)
+        row.updated_at_utc = now
+        session.add(row)
+    session.commit()
+
+
 def top_by_section(items: Iterable[Item], limit_by_section: dict[Section, int]) -> dict[Section, list[Item]]:
     grouped: dict[Section, list[Item]] = {s: [] for s in Section}
     for item in items:
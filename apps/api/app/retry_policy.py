@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+import httpx
+
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 2
+    base_delay_s: float = float(os.getenv("NEXUS_RETRY_BASE_DELAY_S", "0.5"))
+    max_delay_s: float = float(os.getenv("NEXUS_RETRY_MAX_DELAY_S", "30"))
+    # Consecutive retryable failures after which a host is skipped for `breaker_cooldown_s`.
+    breaker_threshold: int = int(os.getenv("NEXUS_BREAKER_THRESHOLD", "3"))
+    breaker_cooldown_s: float = float(os.getenv("NEXUS_BREAKER_COOLDOWN_S", "600"))
+
+
+class _CircuitBreaker:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._open_until: dict[str, float] = {}
+
+    def check(self, host: str) -> None:
+        with self._lock:
+            until = self._open_until.get(host)
+        if until is not None and time.monotonic() < until:
+            raise CircuitOpenError(f"circuit open for {host} (too many recent failures)")
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            self._open_until.pop(host, None)
+
+    def record_failure(self, host: str, policy: RetryPolicy) -> None:
+        with self._lock:
+            n = self._failures.get(host, 0) + 1
+            self._failures[host] = n
+            if n >= policy.breaker_threshold:
+                self._open_until[host] = time.monotonic() + policy.breaker_cooldown_s
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._open_until.clear()
+
+
+breaker = _CircuitBreaker()
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def is_retryable(exc: Exception) -> bool:
+    """
+    Transport errors (timeouts, resets, DNS) and 408/425/429/5xx are worth retrying;
+    other 4xx responses will not change on a retry.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_after_s(exc: Exception) -> Optional[float]:
+    if not isinstance(exc, httpx.HTTPStatusError) or exc.response.status_code not in {429, 503}:
+        return None
+    value = (exc.response.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return max(0.0, (at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay_s(attempt: int, exc: Exception, policy: RetryPolicy) -> float:
+    """
+    Delay before retry number `attempt + 1`: Retry-After when the server sent one, otherwise
+    exponential backoff with full jitter. Always capped at `policy.max_delay_s`.
+    """
+    retry_after = _retry_after_s(exc)
+    if retry_after is not None:
+        return min(retry_after, policy.max_delay_s)
+    ceiling = min(policy.max_delay_s, policy.base_delay_s * (2**attempt))
+    return random.uniform(0.0, ceiling)
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    *,
+    url: str,
+    policy: RetryPolicy,
+    retryable: Callable[[Exception], bool] = is_retryable,
+) -> T:
+    host = host_of(url)
+    for attempt in range(policy.max_retries + 1):
+        breaker.check(host)
+        try:
+            result = fn()
+        except Exception as e:  # noqa: BLE001
+            if not retryable(e):
+                raise
+            # Only transport errors and 429/5xx say something about the host's health.
+            if is_retryable(e):
+                breaker.record_failure(host, policy)
+            if attempt >= policy.max_retries:
+                raise
+            time.sleep(backoff_delay_s(attempt, e, policy))
+            continue
+        breaker.record_success(host)
+        return result
+    raise AssertionError("unreachable")
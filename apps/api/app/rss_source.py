@@ -1,38 +1,27 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
-from typing import List, Optional
+import os
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Iterator, List, Optional
 
 import feedparser
 
+from app.feed_parser import FeedParseError, iter_feed_entries, parse_feed_date
 from app.http_client import fetch_text
 from app.ingestion_types import RawIngestedItem
 from app.models import ItemType, TimestampConfidence, TimestampPrecision
+from app.parallel import run_cpu
 from app.time_semantics import EditionWindow
 from app.url_utils import canonicalize_url
+from app.watermarks import Watermark
 
 
-def _published_dt_utc(entry: dict) -> Optional[datetime]:
-    if "published" in entry and entry["published"]:
-        try:
-            dt = parsedate_to_datetime(entry["published"])
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except Exception:  # noqa: BLE001
-            pass
+FEED_PARSER = os.getenv("NEXUS_FEED_PARSER", "lxml")
 
-    if "updated" in entry and entry["updated"]:
-        try:
-            dt = parsedate_to_datetime(entry["updated"])
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except Exception:  # noqa: BLE001
-            pass
 
-    return None
+def _published_dt_utc(entry: dict) -> Optional[datetime]:
+    return parse_feed_date(entry.get("published")) or parse_feed_date(entry.get("updated"))
 
 
 def _entry_text(entry: dict) -> str:
@@ -45,16 +34,89 @@ def _entry_text(entry: dict) -> str:
     return ""
 
 
-def fetch_rss_items(
+def _to_raw(
+    *,
+    title: str,
+    link: str,
+    published: datetime,
+    text: str,
+    tags: list[str],
+    source_name: str,
+    item_type: ItemType,
+    reliability: Optional[str],
+) -> RawIngestedItem:
+    source_url = canonicalize_url(link)
+    return RawIngestedItem(
+        item_type=item_type,
+        source=source_name,
+        source_url=source_url,
+        canonical_url=source_url,
+        external_id=None,
+        title=title,
+        published_at_utc=published,
+        summary_text=text,
+        content_text=None,
+        tags=tags,
+        source_reliability=reliability,
+        timestamp_precision=TimestampPrecision.exact,
+        timestamp_confidence=TimestampConfidence.high,
+    )
+
+
+def _in_window(published: datetime, window: EditionWindow) -> bool:
+    return window.utc_start <= published <= window.utc_end
+
+
+def _iter_lxml(
+    document: str,
     window: EditionWindow,
     *,
-    feed_url: str,
     source_name: str,
-    item_type: ItemType = ItemType.news,
-    max_items: int = 100,
-    reliability: Optional[str] = None,
+    item_type: ItemType,
+    max_items: int,
+    reliability: Optional[str],
+    watermark: Optional[Watermark],
+) -> Iterator[RawIngestedItem]:
+    """
+    Fast path: lxml parse with the same filtering as feedparser. Every entry up to
+    `max_items` is checked; feed order is not trusted, since one pinned or out-of-order
+    entry must not hide the in-window entries after it.
+    """
+    for idx, entry in enumerate(iter_feed_entries(document)):
+        if idx >= max_items:
+            return
+        published = entry.published_at_utc
+        if published is None:
+            continue
+        if not entry.title or not entry.link or not _in_window(published, window):
+            continue
+
+        raw = _to_raw(
+            title=entry.title,
+            link=entry.link,
+            published=published,
+            text=entry.text,
+            tags=entry.tags,
+            source_name=source_name,
+            item_type=item_type,
+            reliability=reliability,
+        )
+        if watermark is not None and watermark.covers(published, raw.source_url):
+            continue
+        yield raw
+
+
+def _parse_feedparser(
+    document: str,
+    window: EditionWindow,
+    *,
+    source_name: str,
+    item_type: ItemType,
+    max_items: int,
+    reliability: Optional[str],
+    watermark: Optional[Watermark],
 ) -> list[RawIngestedItem]:
-    parsed = feedparser.parse(fetch_text(feed_url))
+    parsed = feedparser.parse(document)
     out: List[RawIngestedItem] = []
 
     for entry in parsed.entries[:max_items]:
@@ -64,39 +126,85 @@ def fetch_rss_items(
             continue
 
         published = _published_dt_utc(entry)
-        if published is None:
+        if published is None or not _in_window(published, window):
             continue
 
-        if published < window.utc_start or published > window.utc_end:
-            continue
-
-        source_url = canonicalize_url(link)
-        canonical = source_url
-
         tags = []
         for t in entry.get("tags") or []:
             term = (t.get("term") or "").strip()
             if term:
                 tags.append(term)
 
-        text = _entry_text(entry)
-        out.append(
-            RawIngestedItem(
-                item_type=item_type,
-                source=source_name,
-                source_url=source_url,
-                canonical_url=canonical,
-                external_id=None,
-                title=title,
-                published_at_utc=published,
-                summary_text=text,
-                content_text=None,
-                tags=tags,
-                source_reliability=reliability,
-                timestamp_precision=TimestampPrecision.exact,
-                timestamp_confidence=TimestampConfidence.high,
-            )
+        raw = _to_raw(
+            title=title,
+            link=link,
+            published=published,
+            text=_entry_text(entry),
+            tags=tags,
+            source_name=source_name,
+            item_type=item_type,
+            reliability=reliability,
         )
+        if watermark is not None and watermark.covers(published, raw.source_url):
+            continue
+        out.append(raw)
 
     return out
 
+
+def parse_rss_items(
+    document: str,
+    window: EditionWindow,
+    *,
+    source_name: str,
+    item_type: ItemType = ItemType.news,
+    max_items: int = 100,
+    reliability: Optional[str] = None,
+    watermark: Optional[Watermark] = None,
+    parser: str = FEED_PARSER,
+) -> list[RawIngestedItem]:
+    """
+    Entries of an RSS/Atom document inside `window`. Uses the lxml fast path unless
+    `parser="feedparser"`; malformed feeds fall back to feedparser's lenient parser.
+    Entries already covered by `watermark` (ingested on an earlier run) are skipped.
+    """
+    kwargs = dict(
+        source_name=source_name,
+        item_type=item_type,
+        max_items=max_items,
+        reliability=reliability,
+        watermark=watermark,
+    )
+    if parser != "feedparser":
+        try:
+            return list(_iter_lxml(document, window, **kwargs))
+        except FeedParseError:
+            pass
+    return _parse_feedparser(document, window, **kwargs)
+
+
+def fetch_rss_items(
+    window: EditionWindow,
+    *,
+    feed_url: str,
+    source_name: str,
+    item_type: ItemType = ItemType.news,
+    max_items: int = 100,
+    reliability: Optional[str] = None,
+    watermark: Optional[Watermark] = None,
+    executor: Optional[Executor] = None,
+) -> list[RawIngestedItem]:
+    """
+    Fetch the feed in the calling thread; parse it in `executor` when one is given.
+    """
+    return run_cpu(
+        executor,
+        parse_rss_items,
+        fetch_text(feed_url, use_cache=True),
+        window,
+        source_name=source_name,
+        item_type=item_type,
+        max_items=max_items,
+        reliability=reliability,
+        watermark=watermark,
+    )
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import Executor
+from typing import Optional
+
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from app.http_client import fetch_text
+from app.parallel import run_cpu
 from app.text_utils import normalize_ws
 
 
-def scrape_article_text(url: str, *, max_chars: int = 12_000) -> str:
-    html = fetch_text(url)
+# Article pages are mostly inline JS/CSS; 12k chars of paragraphs never need more than this.
+SCRAPE_MAX_BYTES = int(os.getenv("NEXUS_SCRAPE_MAX_BYTES", str(2 * 1024 * 1024)))
+SCRAPE_PARSE_MODE = os.getenv("NEXUS_SCRAPE_PARSE_MODE", "stream")
+
+_EXCLUDED_TAGS = {"script", "style", "noscript", "header", "footer", "nav"}
+_META_NAMES = ("description", "og:description")
+_FEED_CHUNK = 64 * 1024
+
+
+def _extract_full(html: str) -> list[str]:
     soup = BeautifulSoup(html, "lxml")
 
-    for t in soup(["script", "style", "noscript", "header", "footer", "nav"]):
+    for t in soup(list(_EXCLUDED_TAGS)):
         t.decompose()
 
     article = soup.find("article")
@@ -18,7 +32,7 @@ def scrape_article_text(url: str, *, max_chars: int = 12_000) -> str:
 
     parts: list[str] = []
 
-    for meta_name in ["description", "og:description"]:
+    for meta_name in _META_NAMES:
         m = soup.find("meta", attrs={"name": meta_name}) or soup.find("meta", attrs={"property": meta_name})
         if m and m.get("content"):
             parts.append(str(m.get("content")))
@@ -27,7 +41,84 @@ def scrape_article_text(url: str, *, max_chars: int = 12_000) -> str:
         txt = p.get_text(" ", strip=True)
         if txt and len(txt) >= 40:
             parts.append(txt)
+    return parts
+
+
+def _extract_stream(html: str, max_chars: int) -> list[str]:
+    """
+    Incremental lxml parse that collects the same parts as `_extract_full` but stops once
+    `max_chars` of paragraph text is collected. Paragraphs inside <article> win when the page
+    has one; if the cap is reached before any <article> appears, body paragraphs are used.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    metas: dict[str, str] = {}
+    article_parts: list[str] = []
+    body_parts: list[str] = []
+    article_chars = 0
+    body_chars = 0
+    excluded_depth = 0
+    article_depth = 0
+    seen_article = False
 
+    for offset in range(0, len(html), _FEED_CHUNK):
+        parser.feed(html[offset : offset + _FEED_CHUNK])
+        for event, el in parser.read_events():
+            tag = el.tag if isinstance(el.tag, str) else ""
+            if event == "start":
+                if tag in _EXCLUDED_TAGS:
+                    excluded_depth += 1
+                elif tag == "article":
+                    article_depth += 1
+                    seen_article = True
+                elif tag == "meta":
+                    key = el.get("name") or el.get("property")
+                    content = el.get("content")
+                    if key in _META_NAMES and content and key not in metas:
+                        metas[key] = content
+                continue
+
+            if tag in _EXCLUDED_TAGS:
+                excluded_depth -= 1
+            elif tag == "article":
+                article_depth -= 1
+            elif tag == "p" and excluded_depth == 0:
+                txt = normalize_ws(" ".join(el.itertext()))
+                if len(txt) >= 40:
+                    body_parts.append(txt)
+                    body_chars += len(txt) + 1
+                    if article_depth:
+                        article_parts.append(txt)
+                        article_chars += len(txt) + 1
+                el.clear(keep_tail=True)
+
+        if (seen_article and article_chars >= max_chars) or (not seen_article and body_chars >= max_chars):
+            break
+
+    parts = [metas[name] for name in _META_NAMES if name in metas]
+    parts.extend(article_parts if seen_article else body_parts)
+    return parts
+
+
+def extract_article_text(html: str, *, max_chars: int = 12_000, mode: str = SCRAPE_PARSE_MODE) -> str:
+    """
+    Extract description and paragraph text from article HTML (CPU-bound; safe to run in a
+    worker process). `mode="stream"` stops parsing once `max_chars` is collected; `mode="full"`
+    builds the whole BeautifulSoup tree.
+    """
+    parts = _extract_stream(html, max_chars) if mode == "stream" else _extract_full(html)
     text = normalize_ws("\n".join(parts))
     return text[:max_chars]
 
+
+def scrape_article_text(
+    url: str,
+    *,
+    max_chars: int = 12_000,
+    mode: str = SCRAPE_PARSE_MODE,
+    executor: Optional[Executor] = None,
+) -> str:
+    """
+    Fetch an article page (byte-capped) and extract its text, in `executor` when one is given.
+    """
+    html = fetch_text(url, max_bytes=SCRAPE_MAX_BYTES)
+    return run_cpu(executor, extract_article_text, html, max_chars=max_chars, mode=mode)
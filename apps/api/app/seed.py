@@ -160,7 +160,6 @@ def seed_items_for_window(window: EditionWindow) -> List[SeedItem]:
 
 
 def to_model(seed: SeedItem, window: EditionWindow) -> Item:
-    summary_md = "\n".join([f"- {b}" for b in seed.summary_bullets])
     return Item(
         id=_uuid_from_url(seed.source_url),
         item_type=seed.item_type,
@@ -172,9 +171,9 @@ def to_model(seed: SeedItem, window: EditionWindow) -> Item:
         published_at_utc=seed.published_at_utc.astimezone(timezone.utc),
         edition_date_local=window.edition_date_local.isoformat(),
         edition_timezone=window.edition_timezone,
-        tags_csv=",".join(seed.tags),
+        tags=list(seed.tags),
         difficulty=seed.difficulty,
-        summary_bullets_md=summary_md,
+        summary_bullets=list(seed.summary_bullets),
         why_it_matters_md=seed.why_it_matters or "",
         market_impact_md=seed.market_impact or "",
         source_reliability=seed.source_reliability,
@@ -31,11 +31,19 @@ class SourceConfig:
     arxiv_max_results: int
     industry_feeds: List[Tuple[str, str]]
     industry_max_items_per_feed: int
+    arxiv_max_pages: int = 40
+    arxiv_page_delay_s: float = 3.0
+    fetch_max_workers: int = 8
+    fetch_max_per_host: int = 2
+    fetch_buffer_items: int = 500
 
 
 def load_source_config() -> SourceConfig:
     arxiv_categories = _split_csv(os.getenv("NEXUS_ARXIV_CATEGORIES", "cs.LG,cs.AI,cs.CL,cs.CV,stat.ML"))
+    # Page size of each arXiv API request; pages are walked until the window is exhausted.
     arxiv_max_results = int(os.getenv("NEXUS_ARXIV_MAX_RESULTS", "250"))
+    arxiv_max_pages = max(1, int(os.getenv("NEXUS_ARXIV_MAX_PAGES", "40")))
+    arxiv_page_delay_s = float(os.getenv("NEXUS_ARXIV_PAGE_DELAY_S", "3"))
 
     default_industry = ",".join(
         [
@@ -47,11 +55,20 @@ def load_source_config() -> SourceConfig:
     )
     industry_feeds = parse_named_urls(os.getenv("NEXUS_INDUSTRY_FEEDS", default_industry))
     industry_max_items = int(os.getenv("NEXUS_INDUSTRY_MAX_ITEMS_PER_FEED", "80"))
+    fetch_max_workers = max(1, int(os.getenv("NEXUS_FETCH_MAX_WORKERS", "8")))
+    fetch_max_per_host = max(1, int(os.getenv("NEXUS_FETCH_MAX_PER_HOST", "2")))
+    # Entries fetched but not yet consumed by the ingest pipeline; producers block beyond this.
+    fetch_buffer_items = max(1, int(os.getenv("NEXUS_FETCH_BUFFER_ITEMS", "500")))
 
     return SourceConfig(
         arxiv_categories=arxiv_categories,
         arxiv_max_results=arxiv_max_results,
+        arxiv_max_pages=arxiv_max_pages,
+        arxiv_page_delay_s=arxiv_page_delay_s,
         industry_feeds=industry_feeds,
         industry_max_items_per_feed=industry_max_items,
+        fetch_max_workers=fetch_max_workers,
+        fetch_max_per_host=fetch_max_per_host,
+        fetch_buffer_items=fetch_buffer_items,
     )
 
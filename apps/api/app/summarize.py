@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from app.keywords import HINT_KEYWORDS
 from app.models import ItemType
 from app.text_utils import split_sentences, strip_htmlish
 
@@ -31,12 +32,12 @@ def summarize_bullets(item_type: ItemType, title: str, text: str, *, max_bullets
 def why_it_matters_hint(item_type: ItemType, title: str, text: str) -> str | None:
     if item_type != ItemType.paper:
         return None
-    t = f"{title}\n{text}".lower()
-    if "open source" in t or "code" in t or "github" in t:
+    hits = HINT_KEYWORDS.scan(f"{title}\n{text}")
+    if "why.code" in hits:
         return "Provides an implementable result with released code, making follow-up experimentation faster."
-    if "benchmark" in t or "dataset" in t:
+    if "why.benchmark" in hits:
         return "Adds a new benchmark signal that can shift evaluation and model selection decisions."
-    if "theorem" in t or "proof" in t:
+    if "why.theory" in hits:
         return "Clarifies a theoretical mechanism that can inform architecture and training choices."
     return "Useful signal for tracking where research effort is moving."
 
@@ -44,12 +45,12 @@ def why_it_matters_hint(item_type: ItemType, title: str, text: str) -> str | Non
 def market_impact_hint(item_type: ItemType, title: str, text: str) -> str | None:
     if item_type != ItemType.news:
         return None
-    t = f"{title}\n{text}".lower()
-    if any(k in t for k in ["regulat", "policy", "law", "ban", "compliance"]):
+    hits = HINT_KEYWORDS.scan(f"{title}\n{text}")
+    if "market.regulation" in hits:
         return "Likely impacts compliance expectations and deployment timelines for AI products."
-    if any(k in t for k in ["funding", "acquisition", "valuation", "ipo"]):
+    if "market.capital" in hits:
         return "Signals capital allocation and competitive pressure in the AI ecosystem."
-    if any(k in t for k in ["launch", "release", "product", "api", "model"]):
+    if "market.product" in hits:
         return "May shift the baseline for features or pricing in AI tooling and platforms."
     return "Potentially relevant for product strategy and competitive monitoring."
 
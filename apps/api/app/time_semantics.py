@@ -29,3 +29,44 @@ def edition_window_for_local_date(edition_date_local: date, tz: str) -> EditionW
         utc_start=utc_start,
         utc_end=utc_end,
     )
+
+
+def covering_window(windows: list[EditionWindow]) -> EditionWindow:
+    """
+    Synthetic window spanning the union UTC range of `windows` (fetch once, partition later).
+    Only `utc_start`/`utc_end` are meaningful for range fetches; the label fields are taken
+    from the newest edition.
+    """
+    if not windows:
+        raise ValueError("covering_window needs at least one window")
+    newest = max(windows, key=lambda w: w.utc_start)
+    return EditionWindow(
+        edition_date_local=newest.edition_date_local,
+        edition_timezone=newest.edition_timezone,
+        utc_date=newest.utc_date,
+        utc_start=min(w.utc_start for w in windows),
+        utc_end=max(w.utc_end for w in windows),
+    )
+
+
+def contiguous_range_starts(windows: list[EditionWindow]) -> dict[date, datetime]:
+    """
+    For each window (keyed by utc_date), the utc_start of the run of consecutive UTC days it
+    belongs to. Days between non-adjacent windows are not part of any run.
+    """
+    starts: dict[date, datetime] = {}
+    previous: EditionWindow | None = None
+    for window in sorted(windows, key=lambda w: w.utc_start):
+        if previous is not None and window.utc_date - previous.utc_date <= timedelta(days=1):
+            starts[window.utc_date] = starts[previous.utc_date]
+        else:
+            starts[window.utc_date] = window.utc_start
+        previous = window
+    return starts
+
+
+def window_for_utc(windows_by_utc_date: dict[date, EditionWindow], published_at_utc: datetime) -> EditionWindow | None:
+    window = windows_by_utc_date.get(published_at_utc.astimezone(timezone.utc).date())
+    if window is None or published_at_utc < window.utc_start or published_at_utc > window.utc_end:
+        return None
+    return window
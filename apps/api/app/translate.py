@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import sys
+from datetime import date, datetime
 from typing import Any, Iterable
 
+from sqlmodel import Session
+
+from app.db import init_db, session_scope
+from app.editions import refresh_edition_snapshots
 from app.openrouter_client import chat_json, load_openrouter_config
+from app.repo import list_items_for_edition
+from app.time_semantics import local_today
 from app.translation_prompt import system_prompt, user_prompt
 
 
@@ -12,12 +22,46 @@ def _chunks(seq: list[Any], size: int) -> Iterable[list[Any]]:
         yield seq[i : i + size]
 
 
-def translate_items_to_zh(items: list[Any], *, batch_size: int = 18) -> dict[str, dict[str, Any]]:
+def translation_input(item) -> dict[str, Any]:
+    return {
+        "id": str(item.id),
+        "title": item.title,
+        "tags": list(item.tags or []),
+        "summary_bullets": list(item.summary_bullets or []),
+        "why_it_matters": item.why_it_matters_md or None,
+        "market_impact": item.market_impact_md or None,
+    }
+
+
+def translation_source_hash(fields: dict[str, Any]) -> str:
+    """
+    Hash of the English fields in a `translation_input` dict (the id is left out).
+    """
+    source = {k: v for k, v in fields.items() if k != "id"}
+    blob = json.dumps(source, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def needs_translation(item) -> bool:
+    """
+    True when the item has no translation yet, or its English fields changed since the last one.
+    """
+    if not item.title_zh:
+        return True
+    return item.translation_source_hash != translation_source_hash(translation_input(item))
+
+
+def translate_items_to_zh(
+    items: list[Any],
+    *,
+    batch_size: int = 18,
+    use_cache: bool = True,
+) -> dict[str, dict[str, Any]]:
     """
     Returns mapping: item_id -> translated fields (zh).
     Expects items to have: id, title, tags[], summary_bullets[], why_it_matters, market_impact.
     """
-    cfg = load_openrouter_config()
+    cfg = load_openrouter_config(use_cache=use_cache)
     out: dict[str, dict[str, Any]] = {}
 
     for chunk in _chunks(items, batch_size):
@@ -36,3 +80,129 @@ def translate_items_to_zh(items: list[Any], *, batch_size: int = 18) -> dict[str
             }
     return out
 
+
+def _apply_translation(item, fields: dict[str, Any], source_hash: str) -> None:
+    title_zh = fields.get("title_zh")
+    if isinstance(title_zh, str) and title_zh.strip():
+        item.title_zh = title_zh.strip()
+
+    tags_zh = fields.get("tags_zh") or []
+    item.tags_zh = [t.strip() for t in tags_zh if isinstance(t, str) and t.strip()][:8]
+
+    bullets_zh = fields.get("summary_bullets_zh") or []
+    item.summary_bullets_zh = [b.strip() for b in bullets_zh if isinstance(b, str) and b.strip()]
+
+    w = fields.get("why_it_matters_zh")
+    item.why_it_matters_zh_md = w.strip() if isinstance(w, str) and w.strip() else ""
+    m = fields.get("market_impact_zh")
+    item.market_impact_zh_md = m.strip() if isinstance(m, str) and m.strip() else ""
+    item.translation_source_hash = source_hash
+    item.updated_at_utc = datetime.utcnow()
+
+
+def translate_items(
+    session: Session,
+    items: list[Any],
+    *,
+    force: bool = False,
+    use_llm_cache: bool = True,
+) -> int:
+    """
+    Translate the items whose zh fields are missing or stale (all of them with `force`)
+    and commit. Returns the number of items updated.
+    """
+    trans_in = [translation_input(i) for i in items if force or needs_translation(i)]
+    if not trans_in:
+        return 0
+    source_hashes = {t["id"]: translation_source_hash(t) for t in trans_in}
+    items_by_id = {str(i.id): i for i in items}
+
+    translated = translate_items_to_zh(trans_in, use_cache=use_llm_cache)
+    updated = 0
+    for item_id, fields in translated.items():
+        it = items_by_id.get(item_id)
+        if not it or item_id not in source_hashes:
+            continue
+        _apply_translation(it, fields, source_hashes[item_id])
+        updated += 1
+
+    session.commit()
+    return updated
+
+
+def translate_edition(
+    edition_date_local: date,
+    tz: str,
+    *,
+    dry_run: bool = False,
+    force: bool = False,
+    use_llm_cache: bool = True,
+) -> int:
+    init_db()
+    with session_scope() as session:
+        items = list_items_for_edition(session, edition_date_local.isoformat(), tz)
+        pending = [i for i in items if force or needs_translation(i)]
+        if dry_run:
+            print(f"[dry-run] {edition_date_local.isoformat()} ({tz}): {len(pending)} of {len(items)} item(s) to translate")
+            return 0
+
+        updated = translate_items(session, pending, force=True, use_llm_cache=use_llm_cache)
+        print(f"{edition_date_local.isoformat()} ({tz}): translated {updated} of {len(pending)} pending item(s), {len(items)} total")
+        if updated:
+            refresh_edition_snapshots(session, edition_date_local, tz)
+        return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill or refresh Chinese translations for editions")
+    parser.add_argument("--tz", default="Asia/Shanghai")
+    parser.add_argument("--date", dest="edition_date_local", default=None, help="Local edition date (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=1, help="Number of local edition days to translate (default: 1)")
+    parser.add_argument(
+        "--dates",
+        default=None,
+        help="Comma-separated local edition dates (YYYY-MM-DD,YYYY-MM-DD). Overrides --date/--days if set.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many items would be translated")
+    parser.add_argument("--force", action="store_true", help="Re-translate every item, not just missing or stale ones")
+    parser.add_argument("--no-llm-cache", action="store_true", help="Always call the LLM; bypass the response cache")
+    args = parser.parse_args()
+
+    tz = args.tz
+    if args.dates is not None:
+        raw_dates = [p.strip() for p in str(args.dates).split(",") if p.strip()]
+        if not raw_dates:
+            raise SystemExit("--dates cannot be empty")
+        try:
+            dates = sorted({date.fromisoformat(d) for d in raw_dates}, reverse=True)
+        except ValueError as e:
+            raise SystemExit("--dates must be YYYY-MM-DD,YYYY-MM-DD,...") from e
+    else:
+        if args.edition_date_local is None:
+            d = local_today(tz)
+        else:
+            d = date.fromisoformat(args.edition_date_local)
+
+        if args.days < 1 or args.days > 31:
+            raise SystemExit("--days must be between 1 and 31")
+
+        dates = [d.fromordinal(d.toordinal() - i) for i in range(args.days)]
+
+    total = 0
+    try:
+        for d in dates:
+            total += translate_edition(
+                d,
+                tz,
+                dry_run=bool(args.dry_run),
+                force=bool(args.force),
+                use_llm_cache=not args.no_llm_cache,
+            )
+    except Exception as e:  # noqa: BLE001
+        print(f"error: {e}", file=sys.stderr)
+        raise
+    print(f"done: translated {total} item(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from app.ingestion_types import RawIngestedItem
+
+
+def _utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class Watermark:
+    """
+    High-water mark for one source: everything published in
+    [covered_from_utc, published_at_utc] has already been ingested. `seen_keys` holds the
+    source_urls seen exactly at `published_at_utc`, so entries sharing that timestamp
+    are not lost.
+    """
+
+    covered_from_utc: datetime
+    published_at_utc: datetime
+    seen_keys: frozenset[str]
+
+    def covers(self, published_at_utc: datetime, source_url: str) -> bool:
+        published = _utc(published_at_utc)
+        if published < self.covered_from_utc or published > self.published_at_utc:
+            return False
+        if published == self.published_at_utc:
+            return source_url in self.seen_keys
+        return True
+
+    def exhausts(self, published_at_utc: datetime, window_utc_start: datetime) -> bool:
+        """
+        True when, walking a newest-first stream, nothing at or below `published_at_utc` can
+        be new for a window starting at `window_utc_start`.
+        """
+        return _utc(published_at_utc) < self.published_at_utc and _utc(window_utc_start) >= self.covered_from_utc
+
+
+def watermark_from_row(covered_from_utc: datetime, published_at_utc: datetime, seen_keys: Iterable[str]) -> Watermark:
+    return Watermark(
+        covered_from_utc=_utc(covered_from_utc),
+        published_at_utc=_utc(published_at_utc),
+        seen_keys=frozenset(seen_keys),
+    )
+
+
+def advance_watermark(
+    existing: Optional[Watermark],
+    items: list[RawIngestedItem],
+    *,
+    range_start_utc: datetime,
+) -> Optional[Watermark]:
+    """
+    Watermark after a successful write of `items`, fetched for a range starting at
+    `range_start_utc`. Overlapping coverage is merged; a disjoint older range keeps the
+    existing (newer) watermark.
+    """
+    if not items:
+        return existing
+
+    newest = max(_utc(i.published_at_utc) for i in items)
+    keys = {i.source_url for i in items if _utc(i.published_at_utc) == newest}
+    fresh = Watermark(covered_from_utc=_utc(range_start_utc), published_at_utc=newest, seen_keys=frozenset(keys))
+    if existing is None:
+        return fresh
+
+    if fresh.published_at_utc < existing.covered_from_utc:
+        return existing
+    if existing.published_at_utc < fresh.covered_from_utc:
+        return fresh if fresh.published_at_utc > existing.published_at_utc else existing
+
+    covered_from = min(existing.covered_from_utc, fresh.covered_from_utc)
+    if fresh.published_at_utc > existing.published_at_utc:
+        return Watermark(covered_from_utc=covered_from, published_at_utc=fresh.published_at_utc, seen_keys=fresh.seen_keys)
+    if fresh.published_at_utc == existing.published_at_utc:
+        return Watermark(
+            covered_from_utc=covered_from,
+            published_at_utc=existing.published_at_utc,
+            seen_keys=existing.seen_keys | fresh.seen_keys,
+        )
+    return Watermark(covered_from_utc=covered_from, published_at_utc=existing.published_at_utc, seen_keys=existing.seen_keys)
@@ -0,0 +1,124 @@
+"""
+Compare the lxml fast path against feedparser for RSS/Atom parsing.
+
+Run from apps/api:
+
+    python ../../scripts/bench_feed_parser.py captured/techcrunch.xml captured/hf.xml
+    python ../../scripts/bench_feed_parser.py https://huggingface.co/blog/feed.xml
+
+Without arguments, synthetic fixtures are used: a 1,000-entry RSS feed, a feed with `media:`
+and other extension elements, a feed with a pinned older entry at the top, and an Atom feed
+with relative links under `xml:base`. The window is the UTC day of the newest entry, which is
+what a daily run sees. Both parsers must return the same items (URL, title, timestamp).
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "api"))
+
+from app.feed_parser import iter_feed_entries  # noqa: E402
+from app.http_client import fetch_text  # noqa: E402
+from app.rss_source import parse_rss_items  # noqa: E402
+from app.time_semantics import edition_window_for_local_date  # noqa: E402
+
+
+def _synthetic_feed(n: int = 1000) -> str:
+    now = datetime(2025, 12, 17, 23, 0, tzinfo=timezone.utc)
+    items = []
+    for i in range(n):
+        published = format_datetime(now - timedelta(hours=i))
+        items.append(
+            f"<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+            f"<pubDate>{published}</pubDate><category>AI</category>"
+            f"<description><![CDATA[<p>{'Body text. ' * 80}</p>]]></description></item>"
+        )
+    return f"<?xml version='1.0' encoding='UTF-8'?><rss version='2.0'><channel>{''.join(items)}</channel></rss>"
+
+
+def _media_feed() -> str:
+    now = format_datetime(datetime(2025, 12, 17, 12, 0, tzinfo=timezone.utc))
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>"
+        "<rss version='2.0' xmlns:media='http://search.yahoo.com/mrss/' "
+        "xmlns:dc='http://purl.org/dc/elements/1.1/' "
+        "xmlns:content='http://purl.org/rss/1.0/modules/content/' "
+        "xmlns:itunes='http://www.itunes.com/dtds/podcast-1.0.dtd'><channel>"
+        f"<item><title>Alpha &amp; Beta</title><link>https://example.com/a</link><pubDate>{now}</pubDate>"
+        "<media:title>Media title override</media:title><media:description>Media text</media:description>"
+        "<media:content url='https://example.com/a.jpg'/><dc:creator>Ann</dc:creator>"
+        "<itunes:summary>Podcast summary</itunes:summary><content:encoded><![CDATA[<p>Body</p>]]></content:encoded></item>"
+        f"<item><media:title>Media first</media:title><title>Gamma</title><link>https://example.com/g</link>"
+        f"<dc:date>2025-12-17T09:00:00Z</dc:date><media:thumbnail url='https://example.com/g.jpg'/></item>"
+        "</channel></rss>"
+    )
+
+
+def _pinned_feed() -> str:
+    newest = datetime(2025, 12, 17, 20, 0, tzinfo=timezone.utc)
+    stamps = [newest, newest - timedelta(days=30), newest - timedelta(hours=2), newest - timedelta(hours=4)]
+    items = "".join(
+        f"<item><title>Story {i}</title><link>https://example.com/p{i}</link><pubDate>{format_datetime(t)}</pubDate></item>"
+        for i, t in enumerate(stamps)
+    )
+    return f"<?xml version='1.0' encoding='UTF-8'?><rss version='2.0'><channel>{items}</channel></rss>"
+
+
+def _xml_base_feed() -> str:
+    entries = "".join(
+        f"<entry{attr}><title>Post {i}</title><link href='{href}'/><updated>2025-12-17T1{i}:00:00Z</updated></entry>"
+        for i, (attr, href) in enumerate([("", "post0"), (" xml:base='sub/'", "post1"), ("", "https://abs.example/p2")])
+    )
+    return f"<feed xmlns='http://www.w3.org/2005/Atom' xml:base='https://example.com/blog/'><title>t</title>{entries}</feed>"
+
+
+def _load(arg: str) -> str:
+    if arg.startswith(("http://", "https://")):
+        return fetch_text(arg)
+    with open(arg, encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    docs = [(a, _load(a)) for a in sys.argv[1:]] or [
+        ("synthetic", _synthetic_feed()),
+        ("synthetic-media", _media_feed()),
+        ("synthetic-pinned", _pinned_feed()),
+        ("synthetic-xml-base", _xml_base_feed()),
+    ]
+    repeat = int(os.getenv("BENCH_REPEAT", "5"))
+    for label, doc in docs:
+        dates = [e.published_at_utc for e in iter_feed_entries(doc) if e.published_at_utc is not None]
+        newest = max(dates) if dates else datetime.now(timezone.utc)
+        window = edition_window_for_local_date(newest.date() + timedelta(days=1), "UTC")
+        kwargs = dict(source_name="bench", max_items=10_000)
+
+        fast = parse_rss_items(doc, window, parser="lxml", **kwargs)
+        slow = parse_rss_items(doc, window, parser="feedparser", **kwargs)
+        t_fast = _time(lambda: parse_rss_items(doc, window, parser="lxml", **kwargs), repeat)
+        t_slow = _time(lambda: parse_rss_items(doc, window, parser="feedparser", **kwargs), repeat)
+        same = [(r.source_url, r.title, r.published_at_utc) for r in fast] == [
+            (r.source_url, r.title, r.published_at_utc) for r in slow
+        ]
+        print(
+            f"{label}: {len(doc) / 1024:.0f} KiB, {len(fast)} in window | "
+            f"lxml {t_fast * 1000:.1f} ms, feedparser {t_slow * 1000:.1f} ms, "
+            f"speedup x{t_slow / max(t_fast, 1e-9):.1f}, same items: {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
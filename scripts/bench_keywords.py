@@ -0,0 +1,171 @@
+"""
+Compare the single-pass keyword matcher (`app.keywords.HINT_KEYWORDS`) against per-keyword
+substring scans for the classify/summarize/difficulty hints.
+
+Run from apps/api:
+
+    python ../../scripts/bench_keywords.py
+
+The corpus is BENCH_DOCS items (default 2,000), each with a title, a 400-character summary
+and 12k characters of content, which is the size of a scraped article. The text is English
+prose: standard-library docstrings rendered by pydoc. Each item gets the four hints the way
+`to_item_model` computes them. The baseline is the previous `any(k in t for k in ...)`
+implementation, kept here for comparison.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import pydoc
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "api"))
+
+from app.classify import classify_section  # noqa: E402
+from app.keywords import HINT_KEYWORDS  # noqa: E402
+from app.models import ItemType, Section  # noqa: E402
+from app.normalize import _difficulty_hint  # noqa: E402
+from app.summarize import market_impact_hint, why_it_matters_hint  # noqa: E402
+
+
+def _baseline_section(item_type: ItemType, text: str) -> Section:
+    t = text.lower()
+    if item_type == ItemType.paper:
+        if any(k in t for k in ["protein", "molecule", "drug", "chemistry", "biology", "genomics", "materials", "crystal", "weather", "climate"]):
+            return Section.ai_for_science
+        if any(k in t for k in ["education", "classroom", "student", "teacher", "curriculum", "tutor", "learning outcome", "assessment", "rubric"]):
+            return Section.ai_education
+        return Section.ai_theory_arch
+    if any(k in t for k in ["policy", "regulat", "law", "ban", "compliance", "election", "senate", "parliament", "antitrust", "investigation"]):
+        return Section.market_policy
+    if any(k in t for k in ["funding", "ipo", "acquisition", "merger", "valuation", "lawsuit", "fine"]):
+        return Section.market_policy
+    return Section.product_tech
+
+
+def _baseline_why(title: str, text: str) -> str:
+    t = f"{title}\n{text}".lower()
+    if "open source" in t or "code" in t or "github" in t:
+        return "code"
+    if "benchmark" in t or "dataset" in t:
+        return "benchmark"
+    if "theorem" in t or "proof" in t:
+        return "theory"
+    return "default"
+
+
+def _baseline_market(title: str, text: str) -> str:
+    t = f"{title}\n{text}".lower()
+    if any(k in t for k in ["regulat", "policy", "law", "ban", "compliance"]):
+        return "regulation"
+    if any(k in t for k in ["funding", "acquisition", "valuation", "ipo"]):
+        return "capital"
+    if any(k in t for k in ["launch", "release", "product", "api", "model"]):
+        return "product"
+    return "default"
+
+
+def _baseline_difficulty(text: str) -> str | None:
+    t = text.lower()
+    if any(k in t for k in ["theorem", "proof", "convergence", "optimality", "complexity bound"]):
+        return "Advanced"
+    if any(k in t for k in ["ablation", "benchmark", "dataset", "experiment"]):
+        return "Intermediate"
+    return None
+
+
+def _baseline(item_type: ItemType, title: str, summary: str, content: str) -> tuple:
+    combined = "\n".join([title, summary, content])
+    if item_type == ItemType.paper:
+        return (
+            _baseline_section(item_type, combined),
+            _baseline_why(title, summary or content),
+            None,
+            _baseline_difficulty(combined),
+        )
+    return _baseline_section(item_type, combined), None, _baseline_market(title, content or summary), None
+
+
+_PROSE_MODULES = [
+    "argparse", "asyncio", "collections", "csv", "dataclasses", "datetime", "decimal", "email", "functools",
+    "http.client", "inspect", "itertools", "json", "logging", "os", "pathlib", "re", "shutil", "socket",
+    "sqlite3", "ssl", "subprocess", "tarfile", "tempfile", "threading", "typing", "unittest", "zipfile",
+]
+
+_WHY = {
+    "Provides an implementable result": "code",
+    "Adds a new benchmark signal": "benchmark",
+    "Clarifies a theoretical mechanism": "theory",
+    "Useful signal": "default",
+}
+_MARKET = {
+    "Likely impacts compliance": "regulation",
+    "Signals capital allocation": "capital",
+    "May shift the baseline": "product",
+    "Potentially relevant": "default",
+}
+
+
+def _label(hint: str | None, labels: dict[str, str]) -> str | None:
+    if hint is None:
+        return None
+    return next(v for k, v in labels.items() if hint.startswith(k))
+
+
+def _matcher(item_type: ItemType, title: str, summary: str, content: str) -> tuple:
+    combined = "\n".join([title, summary, content])
+    return (
+        classify_section(item_type, combined),
+        _label(why_it_matters_hint(item_type, title, summary or content), _WHY),
+        _label(market_impact_hint(item_type, title, content or summary), _MARKET),
+        _difficulty_hint(combined) if item_type == ItemType.paper else None,
+    )
+
+
+def _corpus(n: int, rng: random.Random) -> list[tuple[ItemType, str, str, str]]:
+    prose = []
+    for name in _PROSE_MODULES:
+        try:
+            prose.append(pydoc.render_doc(importlib.import_module(name), renderer=pydoc.plaintext))
+        except Exception:  # noqa: BLE001
+            continue
+    text = " ".join(" ".join(prose).split())
+
+    items = []
+    for _ in range(n):
+        start = rng.randrange(len(text) - 12_500)
+        title = text[start : start + 80]
+        items.append((rng.choice(list(ItemType)), title, text[start + 80 : start + 480], text[start + 480 : start + 12_480]))
+    return items
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    docs = _corpus(int(os.getenv("BENCH_DOCS", "2000")), random.Random(0))
+    repeat = int(os.getenv("BENCH_REPEAT", "3"))
+
+    def run_matcher() -> list[tuple]:
+        return [_matcher(*d) for d in docs]
+
+    same = [_baseline(*d) for d in docs] == run_matcher()
+    t_base = _time(lambda: [_baseline(*d) for d in docs], repeat)
+    t_new = _time(run_matcher, repeat)
+    print(
+        f"{len(docs)} items | substring scans {t_base * 1000:.0f} ms, "
+        f"keyword matcher {t_new * 1000:.0f} ms, speedup x{t_base / max(t_new, 1e-9):.1f}, "
+        f"same results: {same}"
+    )
+
+
+if __name__ == "__main__":
+    main()